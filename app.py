@@ -6,43 +6,89 @@ Backend API Server - Adapted from Venue Voice structure
 import os
 import sys
 import json
+import atexit
+import logging
+import queue
+import hashlib
 import re
+import orjson
 import requests
-import base64
 import secrets
+import traceback
 from io import BytesIO
+from logging.handlers import QueueHandler, QueueListener
+from html import unescape
 from datetime import datetime
-from functools import wraps
-from flask import Flask, request, jsonify, send_from_directory, Response, redirect, session, url_for
+from urllib.parse import urlparse, urlsplit
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache, wraps
+from flask import Flask, request, jsonify, send_from_directory, Response, redirect, session, url_for, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from authlib.integrations.flask_client import OAuth
 from dotenv import load_dotenv
 from werkzeug.middleware.proxy_fix import ProxyFix
 from bs4 import BeautifulSoup
+from PIL import Image, ImageOps
 import pytz
 
+try:
+    import pybase64 as base64  # SIMD-accelerated, same API as the stdlib module
+except ImportError:
+    import base64
+
+try:
+    import ahocorasick  # optional: one-pass multi-keyword matching, regex fallback
+except ImportError:
+    ahocorasick = None
+
+try:
+    import lxml  # noqa: F401 - optional: C parser for scraped article pages
+    SCRAPE_PARSER = 'lxml'
+except ImportError:
+    SCRAPE_PARSER = 'html.parser'
+
 # SendGrid for email
 try:
-    import sendgrid
     from sendgrid.helpers.mail import Mail, Email, To, Content, HtmlContent
     SENDGRID_AVAILABLE = True
 except ImportError:
     SENDGRID_AVAILABLE = False
     print("[WARNING] SendGrid not installed. Email functionality disabled.")
 
+# Response compression (optional - large JSON payloads shrink several-fold)
+try:
+    from flask_compress import Compress
+    COMPRESS_AVAILABLE = True
+except ImportError:
+    COMPRESS_AVAILABLE = False
+    print("[WARNING] Flask-Compress not installed. Responses will be sent uncompressed.")
+
 # Load environment
 load_dotenv()
 
 # Add backend to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'backend'))
 
-from integrations.openai_client import OpenAIClient
-from integrations.gemini_client import GeminiClient
-from integrations.claude_client import ClaudeClient
-from integrations.perplexity_client import PerplexityClient
-from integrations.ontraport_client import OntraportClient
+from integrations.openai_client import EMBED_MAX_CHARS, get_openai_client
+from integrations.gemini_client import get_gemini_client
+from integrations.claude_client import get_claude_client
+from integrations.perplexity_client import get_perplexity_client
+from integrations.ontraport_client import get_ontraport_client
+from integrations.sendgrid_client import SendGridClient, SendGridError, with_recipients
+from integrations.response_cache import ResponseCache, SemanticCache, make_cache_key
+from integrations.json_utils import iter_json_objects, strip_code_fence
+from integrations.background_jobs import JobRegistry
+from integrations.rate_limit import TokenBucket, RateLimitExceeded
+from integrations.http_pool import build_requests_session
+from request_models import (
+    ResearchArticlesRequest, GenerateContentRequest, GenerateImagesRequest, BrandCheckRequest,
+    BrandCheckBatchRequest
+)
+from response_models import BrandCheckResult
+from pydantic import ValidationError
 from config.brand_guidelines import (
-    BRAND_VOICE, NEWSLETTER_GUIDELINES, INSURANCE_NEWS_SOURCES,
+    BRAND_VOICE, NEWSLETTER_GUIDELINES, INSURANCE_NEWS_SOURCES, INSURANCE_SITE_FILTER,
     CONTENT_FILTERS, ONTRAPORT_CONFIG, TEAM_MEMBERS,
     get_style_guide_for_prompt, get_search_sources_prompt,
     get_humanization_guidelines, get_full_style_guide_for_section
@@ -52,9 +98,70 @@ from config.model_config import get_model_for_task
 # Chicago timezone for timestamps
 CHICAGO_TZ = pytz.timezone('America/Chicago')
 
+# Shared pool for fanning out independent LLM/search calls within a request.
+# The SDKs release the GIL while waiting on the network, so threads overlap well.
+IO_POOL = ThreadPoolExecutor(max_workers=int(os.environ.get('IO_POOL_WORKERS', 16)))
+
+# Searches that always send the same query (no topic from the user) change
+# slowly, so their results are reused for an hour
+GENERIC_SEARCH_CACHE = ResponseCache(maxsize=8, ttl=float(os.environ.get('GENERIC_SEARCH_CACHE_TTL', 3600)))
+
+# Brand-check verdicts keyed on the exact section content; re-running the check
+# after editing a different section shouldn't pay for another Opus call
+BRAND_CHECK_CACHE = ResponseCache(maxsize=128, ttl=float(os.environ.get('BRAND_CHECK_CACHE_TTL', 7 * 86400)))
+
+# Parsed output of the OpenAI research-enrichment passes, keyed on the full
+# request; a refreshed card with the same articles reuses the analysis
+ENRICHMENT_CACHE = ResponseCache(maxsize=256, ttl=float(os.environ.get('LLM_CACHE_TTL', 3600)))
+
+# Newsletter HTML posted to the export routes, keyed by content hash, so a
+# follow-up call (preview, then Ontraport) can send {"html_etag": ...} instead
+# of re-uploading the whole body
+HTML_BLOBS = ResponseCache(maxsize=64, ttl=float(os.environ.get('HTML_BLOB_TTL', 3600)))
+
+# Analyzed articles from /api/fetch-article keyed by canonical URL; pasting a
+# link the team already pulled in skips the scrape and the OpenAI pass
+ARTICLE_CACHE = ResponseCache(maxsize=512, ttl=float(os.environ.get('ARTICLE_CACHE_TTL', 86400)))
+
+# Slow image generation can run as a background job that the frontend polls
+IMAGE_JOBS = JobRegistry(max_workers=int(os.environ.get('IMAGE_JOB_WORKERS', 4)))
+
+# The section images of a request are generated concurrently on their own small
+# pool; its size caps in-flight Nano Banana calls per worker (Gemini rate limits)
+# without tying up IO_POOL threads while requests queue for a slot
+IMAGE_POOL = ThreadPoolExecutor(max_workers=int(os.environ.get('IMAGE_CONCURRENCY', 4)), thread_name_prefix='image')
+
+# Other slow request/response work (brand checks, preview sends) that the
+# frontend can choose to poll for instead of holding a gunicorn thread
+BACKGROUND_JOBS = JobRegistry(max_workers=int(os.environ.get('BACKGROUND_JOB_WORKERS', 8)))
+
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Serve jsonify() and request.json through orjson; Flask's encoder still handles odd types"""
+
+    def dumps(self, obj, **kwargs):
+        # Datetimes go through Flask's default so their wire format doesn't change
+        options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        return orjson.dumps(obj, default=self.default, option=options).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__, static_folder='.')
+app.json = OrjsonProvider(app)
 CORS(app)
 
+# Compress JSON bodies (research/generate responses run to tens of KB)
+if COMPRESS_AVAILABLE:
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    app.config['COMPRESS_MIMETYPES'] = ['application/json']
+    app.config['COMPRESS_MIN_SIZE'] = 512
+    app.config['COMPRESS_LEVEL'] = 4
+    app.config['COMPRESS_BR_LEVEL'] = 4
+    Compress(app)
+
 # Fix for running behind Cloud Run's proxy - ensures correct HTTPS URLs
 app.wsgi_app = ProxyFix(app.wsgi_app, x_proto=1, x_host=1)
 
@@ -87,39 +194,89 @@ def get_current_user():
     """Get current user from session"""
     return session.get('user')
 
+class ConsoleHandler(logging.StreamHandler):
+    """Writes bare messages to stdout, falling back to ASCII on consoles that can't encode them (Windows)"""
+
+    def __init__(self):
+        super().__init__(sys.stdout)
+
+    def emit(self, record):
+        try:
+            message = self.format(record)
+            try:
+                self.stream.write(message + self.terminator)
+            except UnicodeEncodeError:
+                self.stream.write(message.encode('ascii', errors='replace').decode('ascii') + self.terminator)
+            self.flush()
+        except Exception:
+            self.handleError(record)
+
+
+# Request-path logging goes through a queue, so IO_POOL workers hand off a
+# record and move on while one listener thread formats and writes it
+logger = logging.getLogger('newsletter')
+logger.setLevel(logging.INFO)
+logger.propagate = False
+_log_queue = queue.SimpleQueue()
+logger.addHandler(QueueHandler(_log_queue))
+_log_listener = QueueListener(_log_queue, ConsoleHandler())
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+
 # Helper function to safely print Unicode content on Windows
 def safe_print(text):
-    """Print text with proper encoding handling for Windows console"""
-    try:
-        print(text)
-    except UnicodeEncodeError:
-        safe_text = text.encode('ascii', errors='replace').decode('ascii')
-        print(safe_text)
+    """Log text via the queued console logger (handles Windows console encoding)"""
+    logger.info(text)
 
 # Helper function to convert HTML to plain text
+@lru_cache(maxsize=16)
 def html_to_plain_text(html_content):
     """Convert HTML newsletter content to plain text for Ontraport"""
-    text = re.sub(r'<[^>]+>', '', html_content)
-    text = text.replace('&nbsp;', ' ')
-    text = text.replace('&amp;', '&')
-    text = text.replace('&lt;', '<')
-    text = text.replace('&gt;', '>')
-    text = text.replace('&quot;', '"')
-    text = text.replace('&#39;', "'")
-    text = re.sub(r'\s+', ' ', text)
-    text = text.strip()
-    return text
-
-# Initialize AI clients
-openai_client = OpenAIClient()
-gemini_client = GeminiClient()
-if not gemini_client.is_available():
-    print("[WARNING] Gemini image generation not available - add GOOGLE_AI_API_KEY to .env")
-    print("         Get your API key at: https://aistudio.google.com/app/apikey")
+    # One parse strips tags and decodes every entity (&rsquo;, &#8217;, ...)
+    text = BeautifulSoup(html_content, 'html.parser').get_text()
+    return ' '.join(text.split())
+
+
+# Patterns for html_to_doc_text, compiled once instead of on every call
+DOC_LINK_TAG = re.compile(r'<a[^>]*href=["\']([^"\']*)["\'][^>]*>([^<]*)</a>')
+DOC_LI_OPEN = re.compile(r'<li[^>]*>')
+DOC_P_OPEN = re.compile(r'<p[^>]*>')
+DOC_ANY_TAG = re.compile(r'<[^>]+>')
+MARKDOWN_BOLD = re.compile(r'\*\*([^*]+)\*\*')
+EXTRA_BLANK_LINES = re.compile(r'\n{3,}')
+
+# "1." / "1)" numbering the model puts in front of list-style answers
+LIST_NUMBER_PREFIX = re.compile(r'^[\d]+[\.\)]\s*')
+
+
+def html_to_doc_text(html_content):
+    """Convert section HTML to plain text for Google Docs, keeping links, bullets and paragraphs"""
+    if not html_content:
+        return ''
+    text = str(html_content)
+    # Convert links: <a href="url">text</a> -> text (url)
+    text = DOC_LINK_TAG.sub(r'\2 (\1)', text)
+    # Convert <li> to bullet points and <p> to paragraphs
+    text = DOC_LI_OPEN.sub('• ', text).replace('</li>', '\n')
+    text = DOC_P_OPEN.sub('', text).replace('</p>', '\n\n')
+    # Remove all other HTML tags, then decode entities in one pass
+    text = unescape(DOC_ANY_TAG.sub('', text)).replace('\xa0', ' ')
+    # Remove ** markdown bold markers
+    text = MARKDOWN_BOLD.sub(r'\1', text)
+    # Clean up whitespace
+    text = EXTRA_BLANK_LINES.sub('\n\n', text)
+    return text.strip()
+
+# Initialize AI clients through the module singletons, so every caller shares
+# one SDK client (and its connection pool) per provider
+openai_client = get_openai_client()
+# Gemini is only used for images: get_gemini_client() builds it (and imports
+# the google-genai SDK) on the first image request instead of at startup
 
 # Try to initialize Claude (optional)
 try:
-    claude_client = ClaudeClient()
+    claude_client = get_claude_client()
     print("[OK] Claude initialized")
 except Exception as e:
     claude_client = None
@@ -127,20 +284,77 @@ except Exception as e:
 
 # Initialize Perplexity client
 try:
-    perplexity_client = PerplexityClient()
+    perplexity_client = get_perplexity_client()
     print("[OK] Perplexity initialized")
 except Exception as e:
     perplexity_client = None
     print(f"[WARNING] Perplexity not available: {e}")
 
+# Optional semantic tier for the Claude response cache. Off by default: long
+# templated prompts embed close together even when the article differs.
+if claude_client and openai_client.client and os.environ.get('LLM_SEMANTIC_CACHE') == '1':
+    claude_client.semantic_cache = SemanticCache(
+        openai_client.embed,
+        threshold=float(os.environ.get('LLM_SEMANTIC_THRESHOLD', 0.95)),
+        max_chars=EMBED_MAX_CHARS
+    )
+    print("[OK] Claude semantic cache enabled")
+
+# Optional client-side throttle on Claude calls, sized a little under the
+# account's rate-limit tier. Bursts wait up to CLAUDE_RATE_LIMIT_MAX_WAIT
+# seconds; beyond that the request fails fast with a 429 and Retry-After.
+if claude_client and os.environ.get('CLAUDE_REQUESTS_PER_MINUTE'):
+    claude_client.rate_limiter = TokenBucket(
+        requests_per_minute=float(os.environ['CLAUDE_REQUESTS_PER_MINUTE']),
+        tokens_per_minute=float(os.environ.get('CLAUDE_TOKENS_PER_MINUTE', 16000)),
+        max_wait=float(os.environ.get('CLAUDE_RATE_LIMIT_MAX_WAIT', 10))
+    )
+    print("[OK] Claude rate limiter enabled")
+
+# Brand-check verdicts survive small edits (a reworded headline rarely changes
+# the rubric's findings), so this tier uses a looser threshold. Also opt-in.
+BRAND_CHECK_SEMANTIC_CACHE = None
+if openai_client.client and os.environ.get('BRAND_CHECK_SEMANTIC_CACHE') == '1':
+    BRAND_CHECK_SEMANTIC_CACHE = SemanticCache(
+        openai_client.embed,
+        threshold=float(os.environ.get('BRAND_CHECK_SEMANTIC_THRESHOLD', 0.92)),
+        maxsize=128,
+        ttl=BRAND_CHECK_CACHE.ttl,
+        max_chars=EMBED_MAX_CHARS
+    )
+    print("[OK] Brand-check semantic cache enabled")
+
+# Dashboard research queries get retyped with small wording changes ("auto
+# insurance rates" vs "auto insurance rate increases"); this tier answers those
+# from the last Perplexity search in the same time window. Opt-in.
+SEARCH_SEMANTIC_CACHE = None
+if openai_client.client and perplexity_client and os.environ.get('SEARCH_SEMANTIC_CACHE') == '1':
+    SEARCH_SEMANTIC_CACHE = SemanticCache(
+        openai_client.embed,
+        threshold=float(os.environ.get('SEARCH_SEMANTIC_THRESHOLD', 0.92)),
+        maxsize=128,
+        ttl=float(os.environ.get('SEARCH_SEMANTIC_CACHE_TTL', 3600)),
+        max_chars=EMBED_MAX_CHARS
+    )
+    print("[OK] Search semantic cache enabled")
+
 # Initialize Ontraport client
 try:
-    ontraport_client = OntraportClient()
+    ontraport_client = get_ontraport_client()
     print("[OK] Ontraport initialized")
 except Exception as e:
     ontraport_client = None
     print(f"[WARNING] Ontraport not available: {e}")
 
+# SendGrid settings are read once and one client is shared by every email route
+# (check both with and without underscore prefix for Secret Manager)
+SENDGRID_API_KEY = os.environ.get('SENDGRID_API_KEY') or os.environ.get('_SENDGRID_API_KEY')
+SENDGRID_FROM_EMAIL = os.environ.get('SENDGRID_FROM_EMAIL') or os.environ.get('_SENDGRID_FROM_EMAIL') or 'marketing@brite.co'
+SENDGRID_FROM_NAME = os.environ.get('SENDGRID_FROM_NAME') or os.environ.get('_SENDGRID_FROM_NAME') or 'BriteCo Brief'
+sendgrid_client = SendGridClient(SENDGRID_API_KEY) if SENDGRID_AVAILABLE and SENDGRID_API_KEY else None
+# SendGrid's per-request limit on personalizations (i.e. separate recipients)
+SENDGRID_MAX_PERSONALIZATIONS = 1000
+
 # Initialize GCS for drafts
 GCS_BUCKET_NAME = 'briteco-brief-drafts'
 GCS_IMAGES_BUCKET = 'briteco-brief-images'
@@ -238,6 +452,49 @@ def health_check():
 # ROUTES - TEAM MANAGEMENT
 # ============================================================================
 
+@app.errorhandler(ValidationError)
+def handle_validation_error(e):
+    """Reject malformed request bodies with a 400 instead of failing mid-handler"""
+    problems = '; '.join(
+        f"{'.'.join(str(part) for part in err['loc']) or 'body'}: {err['msg']}"
+        for err in e.errors()
+    )
+    print(f"[API ERROR] Invalid request to {request.path}: {problems}")
+    return jsonify({'success': False, 'error': f'Invalid request: {problems}'}), 400
+
+
+@app.errorhandler(RateLimitExceeded)
+def handle_rate_limit(e):
+    """Tell the caller when the Claude throttle will have room again"""
+    retry_after = int(e.retry_after) + 1
+    print(f"[API WARNING] Rate limited {request.path}, retry after {retry_after}s")
+    return jsonify({'success': False, 'error': str(e)}), 429, {'Retry-After': str(retry_after)}
+
+
+@app.route('/api/cache-invalidate', methods=['POST'])
+@login_required
+def cache_invalidate():
+    """Drop cached searches and LLM responses so the next requests fetch fresh results"""
+    GENERIC_SEARCH_CACHE.clear()
+    BRAND_CHECK_CACHE.clear()
+    ENRICHMENT_CACHE.clear()
+    ARTICLE_CACHE.clear()
+    if BRAND_CHECK_SEMANTIC_CACHE is not None:
+        BRAND_CHECK_SEMANTIC_CACHE.clear()
+    if SEARCH_SEMANTIC_CACHE is not None:
+        SEARCH_SEMANTIC_CACHE.clear()
+    if claude_client:
+        claude_client.cache.clear()
+        if claude_client.semantic_cache:
+            claude_client.semantic_cache.clear()
+    openai_client.search_cache.clear()
+    if perplexity_client:
+        perplexity_client.cache.clear()
+
+    print("[API] Response caches cleared")
+    return jsonify({'success': True})
+
+
 @app.route('/api/team-members', methods=['GET'])
 def get_team_members():
     """Get list of team members for preview emails"""
@@ -250,6 +507,42 @@ def get_team_members():
 # HELPER FUNCTIONS - V2 RESEARCH API (Matching venue-voice pattern)
 # ============================================================================
 
+# Human-readable time windows used in search queries and UI labels
+TIME_WINDOW_DESCRIPTIONS = {
+    '7d': 'past week',
+    '15d': 'past 15 days',
+    '30d': 'past month',
+    '90d': 'past 3 months'
+}
+
+# Insurance industry source packs for the Source Explorer (B2B and trade publications)
+SOURCE_PACKS = {
+    'insurance': INSURANCE_NEWS_SOURCES,  # From brand_guidelines.py
+    'claims': [
+        'claimsjournal.com', 'propertycasualty360.com', 'insurancejournal.com',
+        'carriermanagement.com'
+    ],
+    'regulations': [
+        'naic.org', 'insurancejournal.com', 'carriermanagement.com',
+        'propertycasualty360.com'
+    ],
+    'technology': [
+        'dig-in.com', 'insurancejournal.com', 'propertycasualty360.com',
+        'carriermanagement.com'
+    ]
+}
+
+
+@lru_cache(maxsize=64)
+def site_query_for(source_packs: tuple) -> tuple:
+    """
+    Return (sites, site_query) for a sorted tuple of pack names: the packs'
+    sites deduplicated in a stable order, and the site: filter over the first six.
+    """
+    sites = tuple(dict.fromkeys(site for pack in source_packs for site in SOURCE_PACKS.get(pack, ())))
+    return sites, ' OR '.join(f'site:{s}' for s in sites[:6])
+
+
 def transform_to_shared_schema(results: list, source_card: str) -> list:
     """
     Transform raw search results to shared schema for frontend.
@@ -285,15 +578,33 @@ PROMOTION_KEYWORDS = [
 ]
 
 
+def _build_promotion_matcher():
+    """Return a case-insensitive predicate that scans text once for any of the PROMOTION_KEYWORDS"""
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for keyword in PROMOTION_KEYWORDS:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text.lower()), None) is not None
+    # The regex matches case-insensitively itself, so no lowered copy of the text
+    pattern = re.compile('|'.join(map(re.escape, PROMOTION_KEYWORDS)), re.IGNORECASE)
+    return lambda text: pattern.search(text) is not None
+
+
+has_promotion_keyword = _build_promotion_matcher()
+
+
 def filter_promotion_news(results: list) -> list:
     """Filter out promotion/personnel news from search results."""
     filtered = []
     for r in results:
-        title = (r.get('title', '') + ' ' + r.get('headline', '')).lower()
-        description = r.get('description', r.get('snippet', '')).lower()
-        combined_text = title + ' ' + description
+        # One join per article. Not precomputed at ingest: the enrichment
+        # passes rewrite 'headline' right before this filter runs.
+        combined_text = ' '.join((
+            r.get('title', ''), r.get('headline', ''), r.get('description', r.get('snippet', ''))
+        ))
 
-        is_promotion_news = any(keyword in combined_text for keyword in PROMOTION_KEYWORDS)
+        is_promotion_news = has_promotion_keyword(combined_text)
 
         if not is_promotion_news:
             filtered.append(r)
@@ -303,6 +614,26 @@ def filter_promotion_news(results: list) -> list:
     return filtered
 
 
+TRACKING_PARAM_PREFIXES = ('utm_', 'fbclid=', 'gclid=', 'mc_cid=', 'mc_eid=')
+
+
+def canonical_url(url: str) -> str:
+    """
+    Reduce a URL to a dedup key: no scheme, fragment, tracking params, "www."
+    or trailing slash, so syndicated copies of one link collapse together.
+    """
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    query = '&'.join(
+        param for param in parts.query.split('&')
+        if param and not param.lower().startswith(TRACKING_PARAM_PREFIXES)
+    )
+    key = host + parts.path.rstrip('/')
+    return f"{key}?{query}" if query else key
+
+
 def multi_search(queries: list, max_results: int = 4, exclude_urls: list = None) -> list:
     """
     Run multiple search queries and merge/deduplicate results.
@@ -316,32 +647,44 @@ def multi_search(queries: list, max_results: int = 4, exclude_urls: list = None)
     """
     exclude_urls = exclude_urls or []
     all_results = []
-    seen_urls = set()
+    seen_keys = set()
+
+    # The fallbacks are usually needed (each query returns at most 6 results
+    # before dedup), so all queries start at once and are merged in cascade
+    # order. Queries still queued when the earlier ones suffice are cancelled.
+    futures = [
+        IO_POOL.submit(
+            openai_client.search_web_responses_api,
+            query,
+            max_results=6,  # Get extra to account for deduplication
+            exclude_urls=exclude_urls
+        )
+        for query in queries
+    ]
+
+    for i, (query, future) in enumerate(zip(queries, futures)):
+        # Stop early if we have enough
+        if len(all_results) >= max_results:
+            for pending in futures[i:]:
+                pending.cancel()
+            break
 
-    for i, query in enumerate(queries):
-        safe_print(f"[Multi-Search] Query {i+1}/{len(queries)}: {query[:80]}...")
+        logger.info("[Multi-Search] Query %d/%d: %.80s...", i + 1, len(queries), query)
 
         try:
-            results = openai_client.search_web_responses_api(
-                query,
-                max_results=6,  # Get extra to account for deduplication
-                exclude_urls=exclude_urls + list(seen_urls)
-            )
+            results = future.result()
 
             for r in results:
                 url = r.get('url', '')
-                if url and url not in seen_urls:
+                key = canonical_url(url) if url else None
+                if key and key not in seen_keys:
                     all_results.append(r)
-                    seen_urls.add(url)
-
-            safe_print(f"[Multi-Search] Query {i+1} returned {len(results)} results, total unique: {len(all_results)}")
+                    seen_keys.add(key)
 
-            # Stop early if we have enough
-            if len(all_results) >= max_results:
-                break
+            logger.info("[Multi-Search] Query %d returned %d results, total unique: %d", i + 1, len(results), len(all_results))
 
         except Exception as e:
-            safe_print(f"[Multi-Search] Query {i+1} failed: {e}")
+            logger.info("[Multi-Search] Query %d failed: %s", i + 1, e)
             continue
 
     return all_results[:max_results]
@@ -367,14 +710,12 @@ def search_all_signals(time_window: str = '30d', exclude_urls: list = None) -> l
     }
 
     all_results = []
-    seen_urls = set(exclude_urls)
+    seen_keys = {canonical_url(url) for url in exclude_urls if url}
 
-    safe_print(f"[Insight Builder] Searching all 8 insurance signals...")
+    logger.info("[Insight Builder] Searching all 8 insurance signals...")
 
-    # Search each signal
-    for signal, query_terms in SIGNAL_QUERIES.items():
-        try:
-            prompt = f"""Search for recent US news about {signal.replace('_', ' ')} in insurance.
+    def search_signal(signal, query_terms):
+        prompt = f"""Search for recent US news about {signal.replace('_', ' ')} in insurance.
 
 Find articles about the United States with data points, statistics, and business impact.
 Focus on P&C (property and casualty) insurance markets.
@@ -382,25 +723,275 @@ Search terms: {query_terms}
 
 Return results with title, url, publisher, published_date, and summary with key data points."""
 
-            results = openai_client.search_web_responses_api(prompt, max_results=4, exclude_urls=list(seen_urls))
+        return openai_client.search_web_responses_api(prompt, max_results=4, exclude_urls=exclude_urls)
+
+    # The signal searches are independent, so run them all at once. Results are
+    # merged in SIGNAL_QUERIES order, so the earlier signal still claims a URL
+    # that several searches return.
+    futures = {
+        signal: IO_POOL.submit(search_signal, signal, query_terms)
+        for signal, query_terms in SIGNAL_QUERIES.items()
+    }
+
+    for signal, future in futures.items():
+        try:
+            results = future.result()
 
             for r in results:
                 url = r.get('url', '')
-                if url and url not in seen_urls:
+                key = canonical_url(url) if url else None
+                if key and key not in seen_keys:
                     r['signal_source'] = signal  # Tag which signal found this
                     all_results.append(r)
-                    seen_urls.add(url)
+                    seen_keys.add(key)
 
-            safe_print(f"[Insight Builder] Signal '{signal}' returned {len(results)} results")
+            logger.info("[Insight Builder] Signal '%s' returned %d results", signal, len(results))
 
         except Exception as e:
-            safe_print(f"[Insight Builder] Error searching signal '{signal}': {e}")
+            logger.info("[Insight Builder] Error searching signal '%s': %s", signal, e)
             continue
 
-    safe_print(f"[Insight Builder] Total unique results: {len(all_results)}")
+    logger.info("[Insight Builder] Total unique results: %d", len(all_results))
     return all_results
 
 
+# Sort order for the enrichment passes' impact ratings (unknown sorts last)
+IMPACT_RANK = {'HIGH': 0, 'MEDIUM': 1, 'LOW': 2}
+
+
+def impact_rank(result: dict) -> int:
+    return IMPACT_RANK.get(result.get('impact', 'LOW'), 2)
+
+
+def _item_schema(**properties) -> dict:
+    """Strict-mode JSON object schema (an enrichment item, an analyzed article): every property required, nothing extra"""
+    return {
+        "type": "object",
+        "properties": properties,
+        "required": list(properties),
+        "additionalProperties": False,
+    }
+
+
+_TEXT = {"type": "string"}
+_IMPACT = {"type": "string", "enum": ["HIGH", "MEDIUM", "LOW"]}
+
+INSIGHT_ITEM_SCHEMA = _item_schema(
+    headline=_TEXT,
+    impact=_IMPACT,
+    signals={"type": "array", "items": {"type": "string", "enum": [
+        "auto_rates", "homeowners", "commercial", "catastrophe",
+        "regulations", "insurtech", "workforce", "claims"
+    ]}},
+    so_what=_TEXT,
+)
+STORY_ANGLE_ITEM_SCHEMA = _item_schema(
+    story_angle=_TEXT,
+    headline=_TEXT,
+    why_it_matters=_TEXT,
+    content_type={"type": "string", "enum": ["trend", "tip", "news", "insight", "case_study"]},
+)
+RESEARCH_ITEM_SCHEMA = _item_schema(
+    headline=_TEXT,
+    industry_data=_TEXT,
+    so_what=_TEXT,
+    impact=_IMPACT,
+)
+ARTICLE_ANALYSIS_SCHEMA = _item_schema(
+    title=_TEXT,
+    description=_TEXT,
+    publisher=_TEXT,
+    snippet=_TEXT,
+    industry_data=_TEXT,
+    agent_implications=_TEXT,
+    content_type={"type": "string", "enum": ["news", "tip", "trend", "case_study", "insight"]},
+)
+
+
+def _run_enrichment_prompt(model_config: dict, prompt: str, temperature: float, item_schema: dict) -> list:
+    """
+    Send an enrichment prompt to the research_enrichment model and return the
+    list of items it generates. Output is constrained to {"items": [item_schema, ...]}
+    with structured outputs. Shared by the three enrichment passes below.
+    """
+    # Build API call with correct parameter name based on model
+    api_params = {
+        "model": model_config.get('id', 'gpt-5.2'),
+        "messages": [{"role": "user", "content": prompt}],
+        "temperature": temperature,
+        "response_format": {
+            "type": "json_schema",
+            "json_schema": {
+                "name": "enrichment",
+                "strict": True,
+                "schema": {
+                    "type": "object",
+                    "properties": {"items": {"type": "array", "items": item_schema}},
+                    "required": ["items"],
+                    "additionalProperties": False,
+                },
+            },
+        },
+    }
+    api_params[model_config.get('max_tokens_param', 'max_tokens')] = 2000
+
+    # Low-temperature output is close to deterministic, so an identical
+    # request can reuse the last answer; higher temperatures want variety
+    cache_key = make_cache_key(api_params) if temperature <= 0.5 else None
+    if cache_key:
+        cached = ENRICHMENT_CACHE.get(cache_key)
+        if cached is not None:
+            logger.info("[Enrichment] Cache hit (%d total)", ENRICHMENT_CACHE.stats()['hits'])
+            return cached
+
+    # Stream the items and parse each object as it completes, so a response
+    # cut off at the token limit still yields the items finished before it
+    stream = openai_client.client.chat.completions.create(stream=True, **api_params)
+    received = []
+    finish_reasons = []
+
+    def deltas():
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            if chunk.choices[0].finish_reason:
+                finish_reasons.append(chunk.choices[0].finish_reason)
+            if chunk.choices[0].delta.content:
+                received.append(chunk.choices[0].delta.content)
+                yield received[-1]
+
+    text_stream = deltas()
+    enriched = []
+    try:
+        for item in iter_json_objects(text_stream, level=1):
+            enriched.append(item)
+    except orjson.JSONDecodeError:
+        enriched = []
+        for _ in text_stream:
+            pass
+
+    if not enriched:
+        # Nothing parsed incrementally - parse the whole response instead
+        parsed = orjson.loads(strip_code_fence(''.join(received)))
+        enriched = parsed.get('items', []) if isinstance(parsed, dict) else parsed
+    # Don't pin a truncated answer in the cache
+    if cache_key and finish_reasons != ['length']:
+        ENRICHMENT_CACHE.set(cache_key, enriched)
+    return enriched
+
+
+# Opt-in cost cascade: a first pass on research_enrichment's economy model,
+# with only HIGH-impact or incomplete items re-run on the primary model
+ENRICHMENT_CASCADE = os.environ.get('ENRICHMENT_CASCADE') == '1'
+
+
+# Articles per enrichment call. Larger batches amortize the instructions, but
+# 30+ snippets in one prompt overruns the 2000-token answer and loses accuracy.
+ENRICHMENT_BATCH_SIZE = int(os.environ.get('ENRICHMENT_BATCH_SIZE', 8))
+
+
+def _run_enrichment(model_config: dict, items: list, build_prompt, temperature: float,
+                    item_schema: dict) -> list:
+    """
+    Enrich items with the prompt build_prompt(items) returns, one output
+    object per item in order. The output may come back shorter than items.
+
+    Lists longer than ENRICHMENT_BATCH_SIZE are split and the batches sent in
+    parallel. Must not be called from an IO_POOL task.
+    """
+    if len(items) <= ENRICHMENT_BATCH_SIZE:
+        enriched = _enrich_batch(model_config, items, build_prompt, temperature, item_schema)
+    else:
+        enriched = _enrich_in_parallel(model_config, items, build_prompt, temperature, item_schema)
+
+    if len(enriched) != len(items):
+        # Callers zip outputs onto items, so the tail stays unenriched
+        logger.warning("[Enrichment] Length mismatch: %d outputs for %d items", len(enriched), len(items))
+    return enriched
+
+
+def _enrich_in_parallel(model_config: dict, items: list, build_prompt, temperature: float,
+                        item_schema: dict) -> list:
+    starts = range(0, len(items), ENRICHMENT_BATCH_SIZE)
+    futures = [
+        IO_POOL.submit(
+            _enrich_batch, model_config, items[start:start + ENRICHMENT_BATCH_SIZE],
+            build_prompt, temperature, item_schema
+        )
+        for start in starts
+    ]
+
+    enriched = []
+    error = None
+    for start, future in zip(starts, futures):
+        try:
+            batch_output = future.result()
+        except Exception as e:
+            logger.info("[Enrichment] Batch at item %d failed: %s", start + 1, e)
+            error = e
+            continue
+        # Keep later batches aligned when an earlier one came back short
+        enriched.extend([{}] * (start - len(enriched)))
+        enriched.extend(batch_output)
+
+    if not enriched and error is not None:
+        raise error
+    return enriched
+
+
+def _enrich_batch(model_config: dict, items: list, build_prompt, temperature: float,
+                  item_schema: dict) -> list:
+    """One enrichment request (plus cascade re-run), with one retry for a truncated tail"""
+    enriched = _enrich_items(model_config, items, build_prompt, temperature, item_schema)
+    if 0 < len(enriched) < len(items):
+        logger.info("[Enrichment] Response stopped after %d/%d items, retrying the rest", len(enriched), len(items))
+        try:
+            enriched = list(enriched) + _enrich_items(
+                model_config, items[len(enriched):], build_prompt, temperature, item_schema
+            )
+        except Exception as e:
+            logger.info("[Enrichment] Retry failed, keeping the partial batch: %s", e)
+    return enriched
+
+
+def _enrich_items(model_config: dict, items: list, build_prompt, temperature: float,
+                  item_schema: dict) -> list:
+    if not ENRICHMENT_CASCADE:
+        return _run_enrichment_prompt(model_config, build_prompt(items), temperature, item_schema)
+
+    economy_config = get_model_for_task('research_enrichment', 'economy')
+    enriched = _run_enrichment_prompt(economy_config, build_prompt(items), temperature, item_schema)
+
+    # Blank text fields mark an item the economy model didn't really handle
+    text_fields = [name for name, spec in item_schema['properties'].items() if spec.get('type') == 'string']
+    retry = [
+        i for i in range(len(items))
+        if i >= len(enriched)
+        or not isinstance(enriched[i], dict)
+        or enriched[i].get('impact') == 'HIGH'
+        or not all(enriched[i].get(field) for field in text_fields)
+    ]
+    if not retry:
+        return enriched
+
+    logger.info("[Enrichment] Re-running %d/%d items on %s", len(retry), len(items), model_config.get('id'))
+    try:
+        premium = _run_enrichment_prompt(
+            model_config, build_prompt([items[i] for i in retry]), temperature, item_schema
+        )
+    except Exception as e:
+        logger.info("[Enrichment] Primary-model pass failed, keeping economy output: %s", e)
+        return enriched
+
+    merged = list(enriched) + [None] * (len(items) - len(enriched))
+    for i, item in zip(retry, premium):
+        merged[i] = item
+    # Items neither pass returned can only be at the tail; drop them
+    while merged and merged[-1] is None:
+        merged.pop()
+    return merged
+
+
 def analyze_industry_impact(results: list) -> list:
     """
     Use LLM to analyze each result for insurance industry impact.
@@ -414,22 +1005,20 @@ def analyze_industry_impact(results: list) -> list:
         # Get model config for research enrichment task
         model_config = get_model_for_task('research_enrichment')
         model_id = model_config.get('id', 'gpt-5.2')
-        max_tokens_param = model_config.get('max_tokens_param', 'max_tokens')
 
         safe_print(f"[Insight Builder] Analyzing {len(results)} results with {model_id}...")
 
-        # Build context for GPT
-        results_text = ""
-        for i, r in enumerate(results):
-            results_text += f"""
+        def build_prompt(items):
+            # Build context for GPT
+            results_text = "".join(f"""
 Result {i+1}:
 - Signal: {r.get('signal_source', 'unknown')}
 - Publisher: {r.get('publisher', '')}
 - Raw title: {r.get('title', '')[:100]}
 - Snippet: {r.get('description', r.get('snippet', ''))[:400]}
-"""
+""" for i, r in enumerate(items))
 
-        prompt = f"""You are analyzing news articles for an insurance agent newsletter.
+            return f"""You are analyzing news articles for an insurance agent newsletter.
 
 For each article, determine its impact on P&C insurance agents and their clients.
 
@@ -442,50 +1031,28 @@ For EACH article, provide:
 3. signals: Array of affected categories from [auto_rates, homeowners, commercial, catastrophe, regulations, insurtech, workforce, claims]
 4. so_what: One sentence explaining what agents should do about this
 
-Return a JSON array with exactly {len(results)} objects:
-[
-  {{"headline": "...", "impact": "HIGH|MEDIUM|LOW", "signals": ["..."], "so_what": "..."}},
-  ...
-]
+Return exactly {len(items)} items, one per article in the order given.
 
 Guidelines:
 - HIGH impact: significant rate changes, regulatory changes, market shifts affecting client premiums
 - MEDIUM impact: emerging trends, technology changes, industry forecasts
-- LOW impact: general news, minor updates
+- LOW impact: general news, minor updates"""
 
-Return ONLY the JSON array, no other text."""
-
-        # Build API call with correct parameter name based on model
-        api_params = {
-            "model": model_id,
-            "messages": [{"role": "user", "content": prompt}],
-            "temperature": 0.3,
-        }
-        api_params[max_tokens_param] = 2000
-
-        response = openai_client.client.chat.completions.create(**api_params)
-
-        content = response.choices[0].message.content.strip()
-
-        # Parse JSON response
-        if content.startswith("```"):
-            content = re.sub(r"^```[a-zA-Z]*\n", "", content)
-            content = re.sub(r"\n```$", "", content).strip()
-
-        enriched = json.loads(content)
+        enriched = _run_enrichment(
+            model_config, results, build_prompt, temperature=0.3,
+            item_schema=INSIGHT_ITEM_SCHEMA
+        )
 
         # Merge enriched data back into results
-        for i, r in enumerate(results):
-            if i < len(enriched):
-                r['headline'] = enriched[i].get('headline', r.get('title', ''))
-                r['impact'] = enriched[i].get('impact', 'MEDIUM')
-                r['signals'] = enriched[i].get('signals', [])
-                r['so_what'] = enriched[i].get('so_what', '')
-                r['industry_data'] = r.get('description', r.get('snippet', ''))
+        for r, item in zip(results, enriched):
+            r['headline'] = item.get('headline', r.get('title', ''))
+            r['impact'] = item.get('impact', 'MEDIUM')
+            r['signals'] = item.get('signals', [])
+            r['so_what'] = item.get('so_what', '')
+            r['industry_data'] = r.get('description', r.get('snippet', ''))
 
         # Sort by impact: HIGH first, then MEDIUM, then LOW
-        impact_order = {'HIGH': 0, 'MEDIUM': 1, 'LOW': 2}
-        results.sort(key=lambda x: impact_order.get(x.get('impact', 'LOW'), 2))
+        results.sort(key=impact_rank)
 
         # Filter out promotion/personnel news
         results = filter_promotion_news(results)
@@ -516,21 +1083,19 @@ def analyze_story_angles(results: list, user_query: str) -> list:
         # Get model config for research enrichment task
         model_config = get_model_for_task('research_enrichment')
         model_id = model_config.get('id', 'gpt-5.2')
-        max_tokens_param = model_config.get('max_tokens_param', 'max_tokens')
 
         safe_print(f"[Source Explorer] Analyzing {len(results)} results with {model_id}...")
 
-        # Build context for GPT
-        results_text = ""
-        for i, r in enumerate(results):
-            results_text += f"""
+        def build_prompt(items):
+            # Build context for GPT
+            results_text = "".join(f"""
 Article {i+1}:
 - Title: {r.get('title', '')[:100]}
 - Publisher: {r.get('publisher', '')}
 - Snippet: {r.get('snippet', r.get('description', ''))[:400]}
-"""
+""" for i, r in enumerate(items))
 
-        prompt = f"""You are a newsletter editor for insurance agents. The user searched for: "{user_query}"
+            return f"""You are a newsletter editor for insurance agents. The user searched for: "{user_query}"
 
 Analyze these articles and surface the most interesting story angles for an agent newsletter.
 
@@ -543,49 +1108,28 @@ For EACH article, provide:
 3. why_it_matters: One sentence on why insurance agents should care about this
 4. content_type: One of [trend, tip, news, insight, case_study]
 
-Return a JSON array with exactly {len(results)} objects:
-[
-  {{"story_angle": "...", "headline": "...", "why_it_matters": "...", "content_type": "..."}},
-  ...
-]
+Return exactly {len(items)} items, one per article in the order given.
 
 Guidelines:
 - Focus on actionable insights agents can use with clients
 - Look for data points, trends, or tips that can be turned into content
 - Headlines should be specific and engaging (not generic)
-- Story angles should suggest how to write about this for agent audiences
-
-Return ONLY the JSON array, no other text."""
-
-        # Build API call with correct parameter name based on model
-        api_params = {
-            "model": model_id,
-            "messages": [{"role": "user", "content": prompt}],
-            "temperature": 0.4,
-        }
-        api_params[max_tokens_param] = 2000
+- Story angles should suggest how to write about this for agent audiences"""
 
-        response = openai_client.client.chat.completions.create(**api_params)
-
-        content = response.choices[0].message.content.strip()
-
-        # Parse JSON response
-        if content.startswith("```"):
-            content = re.sub(r"^```[a-zA-Z]*\n", "", content)
-            content = re.sub(r"\n```$", "", content).strip()
-
-        enriched = json.loads(content)
+        enriched = _run_enrichment(
+            model_config, results, build_prompt, temperature=0.4,
+            item_schema=STORY_ANGLE_ITEM_SCHEMA
+        )
 
         # Merge enriched data back into results
-        for i, r in enumerate(results):
-            if i < len(enriched):
-                r['story_angle'] = enriched[i].get('story_angle', '')
-                r['headline'] = enriched[i].get('headline', r.get('title', ''))
-                r['why_it_matters'] = enriched[i].get('why_it_matters', '')
-                r['content_type'] = enriched[i].get('content_type', 'insight')
-                # Update so_what with the why_it_matters
-                r['so_what'] = enriched[i].get('why_it_matters', r.get('so_what', ''))
-                r['industry_data'] = r.get('snippet', r.get('description', ''))
+        for r, item in zip(results, enriched):
+            r['story_angle'] = item.get('story_angle', '')
+            r['headline'] = item.get('headline', r.get('title', ''))
+            r['why_it_matters'] = item.get('why_it_matters', '')
+            r['content_type'] = item.get('content_type', 'insight')
+            # Update so_what with the why_it_matters
+            r['so_what'] = item.get('why_it_matters', r.get('so_what', ''))
+            r['industry_data'] = r.get('snippet', r.get('description', ''))
 
         # Filter out promotion/personnel news
         results = filter_promotion_news(results)
@@ -617,21 +1161,19 @@ def enrich_results_with_llm(results: list, original_query: str) -> list:
         # Get model config for research enrichment task
         model_config = get_model_for_task('research_enrichment')
         model_id = model_config.get('id', 'gpt-5.2')
-        max_tokens_param = model_config.get('max_tokens_param', 'max_tokens')
 
         safe_print(f"[Enrichment] Using model: {model_id}")
 
-        # Build a single prompt to process all results at once
-        results_text = ""
-        for i, r in enumerate(results):
-            results_text += f"""
+        def build_prompt(items):
+            # Build a single prompt to process all results at once
+            results_text = "".join(f"""
 Result {i+1}:
 - URL: {r.get('url', '')}
 - Publisher: {r.get('publisher', '')}
 - Raw snippet: {r.get('snippet', '')[:500]}
-"""
+""" for i, r in enumerate(items))
 
-        prompt = f"""You are analyzing research findings for an insurance agent newsletter. The user searched for: "{original_query}"
+            return f"""You are analyzing research findings for an insurance agent newsletter. The user searched for: "{original_query}"
 
 Here are research findings to transform into newsletter-ready content:
 {results_text}
@@ -642,11 +1184,7 @@ For EACH result, extract/generate:
 3. so_what: What should agents DO with this information? (1 actionable sentence)
 4. impact: HIGH (immediate action needed), MEDIUM (worth monitoring), or LOW (FYI only)
 
-Return a JSON array with exactly {len(results)} objects:
-[
-  {{"headline": "...", "industry_data": "...", "so_what": "...", "impact": "HIGH|MEDIUM|LOW"}},
-  ...
-]
+Return exactly {len(items)} items, one per article in the order given.
 
 Guidelines:
 - Headlines should be specific with data when available (e.g., "Auto Rates Up 8% - Agents Should Review Client Policies")
@@ -654,50 +1192,31 @@ Guidelines:
 - so_what should be a specific action: "Review your...", "Contact clients about...", "Update your..."
 - HIGH impact: significant rate changes, regulatory changes affecting client premiums
 - MEDIUM impact: emerging trends, forecasts, industry shifts
-- LOW impact: general news, minor updates
-
-Return ONLY the JSON array, no other text."""
-
-        # Build API call with correct parameter name based on model
-        api_params = {
-            "model": model_id,
-            "messages": [{"role": "user", "content": prompt}],
-            "temperature": 0.3,
-        }
-        api_params[max_tokens_param] = 2000
-
-        response = openai_client.client.chat.completions.create(**api_params)
-
-        content = response.choices[0].message.content.strip()
-
-        # Parse the JSON response
-        if content.startswith("```"):
-            content = re.sub(r"^```[a-zA-Z]*\n", "", content)
-            content = re.sub(r"\n```$", "", content).strip()
+- LOW impact: general news, minor updates"""
 
-        enriched = json.loads(content)
+        enriched = _run_enrichment(
+            model_config, results, build_prompt, temperature=0.3,
+            item_schema=RESEARCH_ITEM_SCHEMA
+        )
 
         # Merge enriched data back into results
-        for i, r in enumerate(results):
-            if i < len(enriched):
-                r['headline'] = enriched[i].get('headline', r.get('title', ''))
-                r['title'] = r['headline']  # Use headline as title too
-                r['industry_data'] = enriched[i].get('industry_data', r.get('snippet', ''))
-                r['so_what'] = enriched[i].get('so_what', '')
-                r['impact'] = enriched[i].get('impact', 'MEDIUM')
-                # Keep snippet for backwards compatibility
-                r['snippet'] = r['industry_data']
+        for r, item in zip(results, enriched):
+            r['headline'] = item.get('headline', r.get('title', ''))
+            r['title'] = r['headline']  # Use headline as title too
+            r['industry_data'] = item.get('industry_data', r.get('snippet', ''))
+            r['so_what'] = item.get('so_what', '')
+            r['impact'] = item.get('impact', 'MEDIUM')
+            # Keep snippet for backwards compatibility
+            r['snippet'] = r['industry_data']
 
         # Sort by impact: HIGH first, then MEDIUM, then LOW
-        impact_order = {'HIGH': 0, 'MEDIUM': 1, 'LOW': 2}
-        results.sort(key=lambda x: impact_order.get(x.get('impact', 'LOW'), 2))
+        results.sort(key=impact_rank)
 
         safe_print(f"[LLM Enrichment] Successfully enriched {len(results)} results with {model_id}")
         return results
 
     except Exception as e:
         safe_print(f"[LLM Enrichment] Error: {e} - returning original results")
-        import traceback
         traceback.print_exc()
         return results
 
@@ -727,12 +1246,21 @@ def v2_search_perplexity():
                 'results': []
             }), 503
 
-        # Search using Perplexity - build insurance-focused query
-        search_results = perplexity_client.search(
-            query=f"P&C insurance {query}",
-            time_window=time_window,
-            max_results=8
-        )
+        # Near-duplicate queries in the same window reuse the earlier search
+        embedding = SEARCH_SEMANTIC_CACHE.embed(query) if SEARCH_SEMANTIC_CACHE else None
+        search_results = SEARCH_SEMANTIC_CACHE.get(embedding, namespace=time_window) if embedding else None
+
+        if search_results is None:
+            # Search using Perplexity - build insurance-focused query
+            search_results = perplexity_client.search(
+                query=f"P&C insurance {query}",
+                time_window=time_window,
+                max_results=8
+            )
+            if embedding and search_results:
+                SEARCH_SEMANTIC_CACHE.set(embedding, search_results, namespace=time_window)
+        else:
+            safe_print(f"[API v2] Perplexity Research: semantic cache hit for '{query}'")
 
         # Filter out excluded URLs
         if exclude_urls:
@@ -747,12 +1275,7 @@ def v2_search_perplexity():
             results = enrich_results_with_llm(results, query)
 
         # Build query description for UI
-        time_desc = {
-            '7d': 'past week',
-            '15d': 'past 15 days',
-            '30d': 'past month',
-            '90d': 'past 3 months'
-        }.get(time_window, 'recent')
+        time_desc = TIME_WINDOW_DESCRIPTIONS.get(time_window, 'recent')
 
         return jsonify({
             'success': True,
@@ -764,7 +1287,6 @@ def v2_search_perplexity():
 
     except Exception as e:
         safe_print(f"[API v2 ERROR] Perplexity Research: {e}")
-        import traceback
         traceback.print_exc()
         return jsonify({'success': False, 'error': str(e), 'results': []}), 500
 
@@ -788,18 +1310,9 @@ def v2_search_insights():
         enriched_results = analyze_industry_impact(raw_results)
 
         # Step 3: Transform to shared schema and limit to top 8-12 results
+        # (carries over the enriched headline, impact, signals, so_what and industry_data)
         results = transform_to_shared_schema(enriched_results[:12], 'insight')
 
-        # Merge back the enriched fields (headline, impact, signals, so_what)
-        for i, result in enumerate(results):
-            if i < len(enriched_results):
-                enriched = enriched_results[i]
-                result['headline'] = enriched.get('headline', result.get('title', ''))
-                result['impact'] = enriched.get('impact', 'MEDIUM')
-                result['signals'] = enriched.get('signals', [])
-                result['so_what'] = enriched.get('so_what', '')
-                result['industry_data'] = enriched.get('industry_data', enriched.get('description', ''))
-
         signals_searched = ['auto_rates', 'homeowners', 'commercial', 'catastrophe', 'regulations', 'insurtech', 'workforce', 'claims']
 
         return jsonify({
@@ -812,7 +1325,6 @@ def v2_search_insights():
 
     except Exception as e:
         safe_print(f"[API v2 ERROR] Insight Builder: {e}")
-        import traceback
         traceback.print_exc()
         return jsonify({'success': False, 'error': str(e), 'results': []}), 500
 
@@ -832,40 +1344,14 @@ def v2_search_sources():
         safe_print(f"\n[API v2] Source Explorer: query='{query}', packs={source_packs}, time_window={time_window}")
 
         # Convert time window to human-readable for query
-        time_desc = {
-            '7d': 'past week',
-            '15d': 'past 15 days',
-            '30d': 'past month',
-            '90d': 'past 3 months'
-        }.get(time_window, 'recent')
-
-        # Insurance industry source packs (B2B and trade publications)
-        SITE_PACKS = {
-            'insurance': INSURANCE_NEWS_SOURCES,  # From brand_guidelines.py
-            'claims': [
-                'claimsjournal.com', 'propertycasualty360.com', 'insurancejournal.com',
-                'carriermanagement.com'
-            ],
-            'regulations': [
-                'naic.org', 'insurancejournal.com', 'carriermanagement.com',
-                'propertycasualty360.com'
-            ],
-            'technology': [
-                'dig-in.com', 'insurancejournal.com', 'propertycasualty360.com',
-                'carriermanagement.com'
-            ]
-        }
+        time_desc = TIME_WINDOW_DESCRIPTIONS.get(time_window, 'recent')
 
-        # Collect sites from selected packs
-        sites = []
-        for pack in source_packs:
-            sites.extend(SITE_PACKS.get(pack, []))
-        sites = list(set(sites))  # Remove duplicates
+        # Collect sites from selected packs (up to 6 per query for better coverage).
+        # Sorted packs and ordered dedup keep the prompts - and cache keys - stable.
+        sites, site_query = site_query_for(tuple(sorted(map(str, source_packs))))
 
         # Build site: queries with 3-query cascade
         if sites:
-            # Use up to 6 sites per query for better coverage
-            site_query = ' OR '.join([f'site:{s}' for s in sites[:6]])
 
             queries = [
                 # Query 1: Site-specific with user query
@@ -923,7 +1409,6 @@ Return results with title, url, publisher, published_date, and summary."""
 
     except Exception as e:
         safe_print(f"[API v2 ERROR] Source Explorer: {e}")
-        import traceback
         traceback.print_exc()
         return jsonify({'success': False, 'error': str(e), 'results': []}), 500
 
@@ -972,7 +1457,8 @@ Output ONLY the rewritten content, no labels or explanations."""
             prompt=prompt,
             model="claude-opus-4-5-20251101",
             temperature=0.4,
-            max_tokens=200
+            max_tokens=200,
+            use_cache=False  # A repeat request means "give me another take"
         )
 
         return jsonify({
@@ -1085,11 +1571,43 @@ Output ONLY the rewritten bullets (one per line starting with •), no labels or
         if not prompt:
             return jsonify({'success': False, 'error': f'Unknown section type: {section}'}), 400
 
+        if data.get('stream'):
+            # Server-sent events: one data frame per text chunk, then a final
+            # "done" event carrying the same payload as the non-streaming response
+            def generate():
+                chunks = []
+                try:
+                    for text in claude_client.stream_content(
+                        prompt=prompt,
+                        model="claude-opus-4-5-20251101",
+                        temperature=0.4,
+                        max_tokens=400
+                    ):
+                        chunks.append(text)
+                        yield f"data: {orjson.dumps(text).decode('utf-8')}\n\n"
+                    done = {
+                        'success': True,
+                        'rewritten': ''.join(chunks).strip(),
+                        'original': content,
+                        'section': section
+                    }
+                except Exception as e:
+                    print(f"[API ERROR] Section rewrite stream: {e}")
+                    done = {'success': False, 'error': str(e)}
+                yield f"event: done\ndata: {orjson.dumps(done).decode('utf-8')}\n\n"
+
+            return Response(
+                stream_with_context(generate()),
+                mimetype='text/event-stream',
+                headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+            )
+
         result = claude_client.generate_content(
             prompt=prompt,
             model="claude-opus-4-5-20251101",
             temperature=0.4,
-            max_tokens=400
+            max_tokens=400,
+            use_cache=False  # A repeat request means "give me another take"
         )
 
         return jsonify({
@@ -1120,29 +1638,50 @@ def search_spotlight_articles():
         print(f"\n[API] Searching Spotlight articles from curated sources: {query}")
 
         all_results = []
-        seen_urls = set(exclude_urls)
-
-        # Build site filter from curated insurance sources
-        site_filter = ' OR '.join([f'site:{s}' for s in INSURANCE_NEWS_SOURCES])
+        seen_keys = {canonical_url(u) for u in exclude_urls if u}
+
+        # The OpenAI and Perplexity searches don't depend on each other, so all
+        # four run at once; results are still merged below in the original
+        # order, so earlier searches keep priority when URLs overlap
+        main_future = IO_POOL.submit(
+            openai_client.search_web,
+            query=f"{query} ({INSURANCE_SITE_FILTER})",
+            exclude_urls=exclude_urls,
+            max_results=8
+        )
+        perplexity_future = None
+        if perplexity_client and perplexity_client.is_available():
+            perplexity_future = IO_POOL.submit(
+                perplexity_client.search,
+                query=f"P&C insurance {query}",
+                time_window=time_window,
+                max_results=6
+            )
+        # Both industry signals target the same two trade sites, so one search
+        # covers them; results are labelled by which signal their text mentions
+        signals = ['insurance rates trends', 'claims news']
+        signal_future = IO_POOL.submit(
+            openai_client.search_web,
+            query=f"({signals[0]}) OR ({signals[1]}) site:insurancejournal.com OR site:propertycasualty360.com",
+            exclude_urls=exclude_urls,
+            max_results=6
+        )
 
         # Search 1: Main query with curated sources (OpenAI)
         try:
-            main_query = f"{query} ({site_filter})"
-            main_results = openai_client.search_web(
-                query=main_query,
-                exclude_urls=list(seen_urls),
-                max_results=8
-            )
+            main_results = main_future.result()
             for r in main_results:
                 url = r.get('url', '')
-                if url and url not in seen_urls:
-                    seen_urls.add(url)
+                key = canonical_url(url) if url else None
+                if key and key not in seen_keys:
+                    seen_keys.add(key)
+                    title = r.get('title', '')
                     all_results.append({
-                        'title': r.get('title', ''),
-                        'headline': r.get('title', ''),
+                        'title': title,
+                        'headline': title,
                         'url': url,
                         'publisher': r.get('publisher', ''),
-                        'snippet': r.get('snippet', r.get('description', '')),
+                        'snippet': r.get('snippet') or r.get('description', ''),
                         'industry_data': r.get('snippet', ''),
                         'so_what': 'Review for InsurNews Spotlight feature story',
                         'source_card': 'curated'
@@ -1152,24 +1691,23 @@ def search_spotlight_articles():
             print(f"  - Curated search error: {e}")
 
         # Search 2: Perplexity for research-backed results (if available)
-        if perplexity_client and perplexity_client.is_available():
+        if perplexity_future is not None:
             try:
-                perplexity_results = perplexity_client.search(
-                    query=f"P&C insurance {query}",
-                    time_window=time_window,
-                    max_results=6
-                )
+                perplexity_results = perplexity_future.result()
                 for r in perplexity_results:
                     url = r.get('url', '')
-                    if url and url not in seen_urls:
-                        seen_urls.add(url)
+                    key = canonical_url(url) if url else None
+                    if key and key not in seen_keys:
+                        seen_keys.add(key)
+                        title = r.get('title', '')
+                        snippet = r.get('snippet', '')
                         all_results.append({
-                            'title': r.get('title', ''),
-                            'headline': r.get('title', ''),
+                            'title': title,
+                            'headline': title,
                             'url': url,
                             'publisher': r.get('publisher', ''),
-                            'snippet': r.get('snippet', ''),
-                            'industry_data': r.get('snippet', ''),
+                            'snippet': snippet,
+                            'industry_data': snippet,
                             'so_what': r.get('agent_implications', 'Research-backed insight'),
                             'source_card': 'perplexity'
                         })
@@ -1179,28 +1717,24 @@ def search_spotlight_articles():
 
         # Search 3: Industry signals/insights
         try:
-            signals = ['insurance rates trends', 'claims news', 'insurance regulations', 'insurtech news']
-            for signal in signals[:2]:
-                signal_query = f"{signal} site:insurancejournal.com OR site:propertycasualty360.com"
-                signal_results = openai_client.search_web(
-                    query=signal_query,
-                    exclude_urls=list(seen_urls),
-                    max_results=3
-                )
-                for r in signal_results:
-                    url = r.get('url', '')
-                    if url and url not in seen_urls:
-                        seen_urls.add(url)
-                        all_results.append({
-                            'title': r.get('title', ''),
-                            'headline': r.get('title', ''),
-                            'url': url,
-                            'publisher': r.get('publisher', ''),
-                            'snippet': r.get('snippet', r.get('description', '')),
-                            'industry_data': r.get('snippet', ''),
-                            'so_what': f'Industry signal: {signal}',
-                            'source_card': 'insights'
-                        })
+            for r in signal_future.result():
+                url = r.get('url', '')
+                key = canonical_url(url) if url else None
+                if key and key not in seen_keys:
+                    seen_keys.add(key)
+                    title = r.get('title', '')
+                    snippet = r.get('snippet') or r.get('description', '')
+                    mentions_claims = 'claim' in f"{title} {snippet}".lower()
+                    all_results.append({
+                        'title': title,
+                        'headline': title,
+                        'url': url,
+                        'publisher': r.get('publisher', ''),
+                        'snippet': snippet,
+                        'industry_data': r.get('snippet', ''),
+                        'so_what': f'Industry signal: {signals[1] if mentions_claims else signals[0]}',
+                        'source_card': 'insights'
+                    })
             print(f"  - Added industry signal results")
         except Exception as e:
             print(f"  - Industry signals error: {e}")
@@ -1216,11 +1750,19 @@ def search_spotlight_articles():
 
     except Exception as e:
         print(f"[API ERROR] Spotlight article search: {e}")
-        import traceback
         traceback.print_exc()
         return jsonify({'success': False, 'error': str(e), 'results': []}), 500
 
 
+# Where the generated spotlight body ends and the agent takeaway starts. An
+# "AGENT TAKEAWAY:" marker wins wherever it is; the bare "TAKEAWAY:" is only a
+# fallback, so e.g. a "Key Takeaway:" earlier in the body doesn't split it.
+TAKEAWAY_MARKERS = (
+    re.compile(r'(?:AGENT TAKEAWAY|Agent Takeaway):'),
+    re.compile(r'(?:TAKEAWAY|Takeaway):'),
+)
+
+
 @app.route('/api/generate-spotlight', methods=['POST'])
 def generate_spotlight():
     """Generate InsurNews Spotlight from multiple source articles"""
@@ -1238,24 +1780,28 @@ def generate_spotlight():
             return jsonify({'success': False, 'error': 'Claude client not available'}), 500
 
         # Build article summaries for the prompt
-        article_summaries = ""
+        summary_parts = []
         sources = []
         for i, article in enumerate(articles, 1):
-            article_summaries += f"""
+            title = article.get('title') or article.get('headline') or ''
+            url = article.get('url', '')
+            publisher = article.get('publisher', '')
+            summary = article.get('snippet') or article.get('industry_data') or ''
+            summary_parts.append(f"""
 ARTICLE {i}:
-Title: {article.get('title', article.get('headline', 'Unknown'))}
-Source: {article.get('publisher', 'Unknown')}
-URL: {article.get('url', '')}
-Summary: {article.get('snippet', article.get('industry_data', ''))}
-"""
+Title: {title or 'Unknown'}
+Source: {publisher or 'Unknown'}
+URL: {url}
+Summary: {summary}
+""")
             sources.append({
-                'title': article.get('title', article.get('headline', '')),
-                'url': article.get('url', ''),
-                'publisher': article.get('publisher', '')
+                'title': title,
+                'url': url,
+                'publisher': publisher
             })
+        article_summaries = ''.join(summary_parts)
 
         # Get humanization guidelines for spotlight section
-        from config.brand_guidelines import get_humanization_guidelines
         humanization_guide = get_humanization_guidelines('spotlight')
 
         prompt = f"""You are writing the "InsurNews Spotlight" section for BriteCo Brief, a newsletter for independent insurance agents.
@@ -1301,20 +1847,20 @@ Output as plain text - headline on first line, then paragraphs separated by blan
 
         # Extract agent takeaway if present
         agent_takeaway = ''
-        takeaway_markers = ['AGENT TAKEAWAY:', 'Agent Takeaway:', 'TAKEAWAY:', 'Takeaway:']
-        for marker in takeaway_markers:
-            if marker in body_text:
-                parts = body_text.split(marker, 1)
-                body_text = parts[0].strip()
-                agent_takeaway = parts[1].strip() if len(parts) > 1 else ''
+        marker = None
+        for pattern in TAKEAWAY_MARKERS:
+            marker = pattern.search(body_text)
+            if marker:
                 break
+        if marker:
+            agent_takeaway = body_text[marker.end():].strip()
+            body_text = body_text[:marker.start()].strip()
 
         # Convert plain text paragraphs to HTML with proper formatting
         # Split by double newlines (paragraph breaks)
         paragraphs = [p.strip() for p in body_text.split('\n\n') if p.strip()]
 
         # Convert markdown links [text](url) to HTML links with blue styling
-        import re
         def convert_links(text):
             return re.sub(
                 r'\[([^\]]+)\]\(([^)]+)\)',
@@ -1323,10 +1869,10 @@ Output as plain text - headline on first line, then paragraphs separated by blan
             )
 
         # Build HTML body with proper paragraph tags and spacing
-        html_body = ''
-        for p in paragraphs:
-            p_with_links = convert_links(p)
-            html_body += f'<p style="margin: 0 0 16px 0; line-height: 1.7;">{p_with_links}</p>'
+        html_body = ''.join(
+            f'<p style="margin: 0 0 16px 0; line-height: 1.7;">{convert_links(p)}</p>'
+            for p in paragraphs
+        )
 
         # Build simple structure - body as HTML
         spotlight_content = {
@@ -1347,7 +1893,6 @@ Output as plain text - headline on first line, then paragraphs separated by blan
 
     except Exception as e:
         print(f"[API ERROR] Spotlight generation: {e}")
-        import traceback
         traceback.print_exc()
         return jsonify({'success': False, 'error': str(e)}), 500
 
@@ -1356,6 +1901,19 @@ Output as plain text - headline on first line, then paragraphs separated by blan
 # ROUTES - FETCH ARTICLE FROM URL
 # ============================================================================
 
+# Fallback container for article text when a page has no <article> or <main>
+ARTICLE_CONTAINER_CLASS = re.compile(r'content|article|post|story', re.I)
+
+# Keep-alive session for scraping, so repeat fetches from the same publisher
+# skip the TCP/TLS handshake
+SCRAPE_SESSION = build_requests_session(pool_size=20)
+SCRAPE_SESSION.headers.update({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+})
+
+
 @app.route('/api/fetch-article', methods=['POST'])
 def fetch_article():
     """Fetch and analyze an article from a user-provided URL using web scraping + OpenAI"""
@@ -1370,52 +1928,45 @@ def fetch_article():
         print(f"\n[API] Fetching article from URL: {url}")
         print(f"  - Section: {section}")
 
-        # Step 1: Fetch the webpage content using requests
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-        }
+        cache_key = canonical_url(url)
+        cached = ARTICLE_CACHE.get(cache_key)
+        if cached is not None:
+            print("[API] Article served from cache")
+            cached['url'] = cached['source_url'] = url
+            return jsonify({
+                'success': True,
+                'article': cached,
+                'generated_at': datetime.now().isoformat()
+            })
 
+        # Step 1: Fetch the webpage content (browser-like headers set on the session)
         try:
-            response = requests.get(url, headers=headers, timeout=15)
+            response = SCRAPE_SESSION.get(url, timeout=15)
             response.raise_for_status()
         except requests.exceptions.RequestException as e:
             print(f"[API] Failed to fetch URL: {str(e)}")
             return jsonify({'success': False, 'error': f'Failed to fetch article: {str(e)}'}), 400
 
-        # Step 2: Parse HTML with BeautifulSoup
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        # Extract title
-        title = ''
-        if soup.title:
-            title = soup.title.string or ''
-        # Try og:title if available
-        og_title = soup.find('meta', property='og:title')
-        if og_title and og_title.get('content'):
-            title = og_title.get('content')
-
-        # Extract meta description
-        meta_desc = ''
-        meta_tag = soup.find('meta', attrs={'name': 'description'})
-        if meta_tag and meta_tag.get('content'):
-            meta_desc = meta_tag.get('content')
-        # Try og:description
-        og_desc = soup.find('meta', property='og:description')
-        if og_desc and og_desc.get('content'):
-            meta_desc = og_desc.get('content')
+        # Step 2: Parse HTML with BeautifulSoup. Raw bytes let the parser pick
+        # the page's declared encoding instead of requests guessing first.
+        soup = BeautifulSoup(response.content, SCRAPE_PARSER)
+
+        # Collect <meta> name/property -> content in one pass instead of a
+        # separate tree walk per tag (first non-empty value wins, like find())
+        head_meta = {}
+        for tag in soup.find_all('meta'):
+            key = tag.get('property') or tag.get('name')
+            if key and key not in head_meta and tag.get('content'):
+                head_meta[key] = tag['content']
+
+        # Extract title (og:title if available)
+        title = head_meta.get('og:title') or (soup.title.string if soup.title else '') or ''
+
+        # Extract meta description (og:description if available)
+        meta_desc = head_meta.get('og:description') or head_meta.get('description', '')
 
         # Extract publisher from og:site_name or domain
-        publisher = ''
-        og_site = soup.find('meta', property='og:site_name')
-        if og_site and og_site.get('content'):
-            publisher = og_site.get('content')
-        else:
-            # Extract from domain
-            from urllib.parse import urlparse
-            parsed = urlparse(url)
-            publisher = parsed.netloc.replace('www.', '')
+        publisher = head_meta.get('og:site_name') or urlparse(url).netloc.replace('www.', '')
 
         # Extract article body text
         # Remove script, style, nav, footer elements
@@ -1429,16 +1980,16 @@ def fetch_article():
             article_text = article.get_text(separator=' ', strip=True)
         else:
             # Fallback to main content area or body
-            main = soup.find('main') or soup.find('div', class_=re.compile(r'content|article|post|story', re.I))
+            main = soup.find('main') or soup.find('div', class_=ARTICLE_CONTAINER_CLASS)
             if main:
                 article_text = main.get_text(separator=' ', strip=True)
             else:
                 article_text = soup.body.get_text(separator=' ', strip=True) if soup.body else ''
 
-        # Clean up whitespace
-        article_text = re.sub(r'\s+', ' ', article_text).strip()
-        # Limit to first 5000 chars to avoid token limits
-        article_text = article_text[:5000]
+        # Limit to first 5000 chars to avoid token limits. Slice before cleaning
+        # up whitespace so long pages aren't normalized only to be thrown away;
+        # the extra 3000 chars cover what the whitespace collapse removes.
+        article_text = ' '.join(article_text[:8000].split())[:5000]
 
         print(f"[API] Scraped {len(article_text)} chars from page")
         print(f"  - Title: {title[:60]}...")
@@ -1468,23 +2019,22 @@ Focus on P&C insurance relevance. If the article is not insurance-related, still
             prompt=analyze_prompt,
             model="gpt-4.1-2025-04-14",
             temperature=0.3,
-            max_tokens=800
+            max_tokens=800,
+            response_format={
+                "type": "json_schema",
+                "json_schema": {"name": "article", "strict": True, "schema": ARTICLE_ANALYSIS_SCHEMA},
+            }
         )
 
-        # Parse the JSON response
-        content_text = result['content'].strip()
-
-        # Remove markdown code blocks if present
-        if content_text.startswith('```'):
-            content_text = content_text.split('```')[1]
-            if content_text.startswith('json'):
-                content_text = content_text[4:]
-            content_text = content_text.strip()
+        # Structured outputs guarantee the shape; the fallback only covers a
+        # response cut off at max_tokens or a refusal
+        content_text = result['content'] or ''
 
         try:
-            article_data = json.loads(content_text)
+            article_data = orjson.loads(content_text)
+            parsed = True
         except json.JSONDecodeError:
-            # Fallback if parsing fails
+            parsed = False
             article_data = {
                 'title': title or 'Article from ' + url,
                 'description': meta_desc or content_text[:200],
@@ -1501,6 +2051,10 @@ Focus on P&C insurance relevance. If the article is not insurance-related, still
         article_data['headline'] = article_data.get('title', '')
         article_data['so_what'] = article_data.get('agent_implications', '')
 
+        # Only cache a real analysis; a fallback should get another try
+        if parsed:
+            ARTICLE_CACHE.set(cache_key, article_data)
+
         print(f"[API] Article analyzed: {article_data.get('title', 'Unknown')}")
 
         return jsonify({
@@ -1511,7 +2065,6 @@ Focus on P&C insurance relevance. If the article is not insurance-related, still
 
     except Exception as e:
         print(f"[API ERROR] Fetch article failed: {str(e)}")
-        import traceback
         traceback.print_exc()
         return jsonify({'success': False, 'error': str(e)}), 500
 
@@ -1531,8 +2084,7 @@ def search_news():
         print(f"\n[API] Searching for insurance news (month: {month})...")
 
         # Build search query for P&C insurance news
-        sources_list = ' OR '.join([f'site:{s}' for s in INSURANCE_NEWS_SOURCES])
-        search_query = f"P&C insurance news {month} 2026 ({sources_list})"
+        search_query = f"P&C insurance news {month} 2026 ({INSURANCE_SITE_FILTER})"
 
         try:
             search_results = openai_client.search_web(
@@ -1565,7 +2117,6 @@ def search_news():
 
         except Exception as e:
             print(f"[API ERROR] Search failed: {e}")
-            import traceback
             traceback.print_exc()
             return jsonify({
                 'success': False,
@@ -1578,6 +2129,9 @@ def search_news():
         print(f"[API ERROR] {str(e)}")
         return jsonify({'success': False, 'error': str(e)}), 500
 
+# Claims-search queries issued concurrently per round (usually one or two rounds)
+CLAIMS_QUERY_WAVE = 4
+
 @app.route('/api/search-claims', methods=['POST'])
 def search_claims():
     """Search for interesting/curious claims stories - unusual, strange, noteworthy insurance cases"""
@@ -1609,33 +2163,45 @@ def search_claims():
         ]
 
         all_results = []
-        seen_urls = set(exclude_urls)
+        # Exclusions sent upstream grow by append; dedup runs on canonical keys
+        sent_urls = list(exclude_urls)
+        seen_keys = {canonical_url(u) for u in exclude_urls if u}
 
         try:
-            # Try each search query until we have enough results
-            for query in CLAIMS_SEARCH_QUERIES:
+            # Run the queries in concurrent waves until we have enough results.
+            # Each wave is merged in query order, so earlier queries keep priority,
+            # and later waves exclude everything found so far.
+            for wave_start in range(0, len(CLAIMS_SEARCH_QUERIES), CLAIMS_QUERY_WAVE):
                 if len(all_results) >= 12:
                     break
 
-                safe_print(f"[Claims Search] Trying query: {query[:60]}...")
-
-                try:
-                    search_results = openai_client.search_web(
+                wave = CLAIMS_SEARCH_QUERIES[wave_start:wave_start + CLAIMS_QUERY_WAVE]
+                wave_excludes = list(sent_urls)
+                futures = []
+                for query in wave:
+                    safe_print(f"[Claims Search] Trying query: {query[:60]}...")
+                    futures.append(IO_POOL.submit(
+                        openai_client.search_web,
                         query=query,
-                        exclude_urls=list(seen_urls),
+                        exclude_urls=wave_excludes,
                         max_results=6
-                    )
+                    ))
+
+                for future in futures:
+                    try:
+                        search_results = future.result()
+                    except Exception as e:
+                        safe_print(f"[Claims Search] Query failed: {e}")
+                        continue
 
                     for result in search_results:
                         url = result.get('url', '')
-                        if url and url not in seen_urls:
+                        key = canonical_url(url) if url else None
+                        if key and key not in seen_keys:
                             result['source_url'] = url
                             all_results.append(result)
-                            seen_urls.add(url)
-
-                except Exception as e:
-                    safe_print(f"[Claims Search] Query failed: {e}")
-                    continue
+                            seen_keys.add(key)
+                            sent_urls.append(url)
 
             # Filter out promotion/personnel news
             all_results = filter_promotion_news(all_results)
@@ -1685,11 +2251,18 @@ def search_tips():
         search_query = f"insurance agent tips sales strategies client retention independent agent advice"
 
         try:
-            search_results = openai_client.search_web(
-                query=search_query,
-                exclude_urls=exclude_urls,
-                max_results=15
-            )
+            # The query is fixed, so a first load (nothing to exclude) can be served from cache
+            search_results = None if exclude_urls else GENERIC_SEARCH_CACHE.get(search_query)
+            if search_results is not None:
+                print(f"[API] Using cached agent tip search")
+            else:
+                search_results = openai_client.search_web(
+                    query=search_query,
+                    exclude_urls=exclude_urls,
+                    max_results=15
+                )
+                if search_results and not exclude_urls:
+                    GENERIC_SEARCH_CACHE.set(search_query, search_results)
 
             for result in search_results:
                 result['source_url'] = result.get('url', '')
@@ -1736,8 +2309,7 @@ def search_roundup():
         print(f"\n[API] Searching for news roundup articles (month: {month})...")
 
         # Build search query for general P&C news
-        sources_list = ' OR '.join([f'site:{s}' for s in INSURANCE_NEWS_SOURCES])
-        search_query = f"property casualty insurance news trends regulations {month} 2026 ({sources_list})"
+        search_query = f"property casualty insurance news trends regulations {month} 2026 ({INSURANCE_SITE_FILTER})"
 
         try:
             search_results = openai_client.search_web(
@@ -1791,8 +2363,7 @@ def search_spotlight():
         print(f"\n[API] Searching for spotlight topics (month: {month})...")
 
         # Build search query for major insurance news
-        sources_list = ' OR '.join([f'site:{s}' for s in INSURANCE_NEWS_SOURCES])
-        search_query = f"major insurance news breaking P&C industry {month} 2026 ({sources_list})"
+        search_query = f"major insurance news breaking P&C industry {month} 2026 ({INSURANCE_SITE_FILTER})"
 
         try:
             search_results = openai_client.search_web(
@@ -1839,27 +2410,36 @@ def search_spotlight():
 # ROUTES - RESEARCH ARTICLES
 # ============================================================================
 
-@app.route('/api/research-articles', methods=['POST'])
-def research_articles():
+def _claude_text(on_text=None, **kwargs) -> str:
     """
-    Research selected articles and produce detailed summaries using GPT.
+    Run a Claude prompt and return its text. With an on_text callback the
+    response is streamed and each chunk is passed to on_text as it arrives.
     """
-    try:
-        data = request.json
-        curious_claims_topic = data.get('curious_claims_topic')
-        roundup_topics = data.get('roundup_topics', [])  # List of 5 articles
-        spotlight_content = data.get('spotlight_content')  # Pre-generated spotlight content from Step 2B
-        agent_tips_topics = data.get('agent_tips_topics', [])  # List of 5 tips
+    if on_text is None:
+        return claude_client.generate_content(**kwargs)['content']
+    chunks = []
+    for text in claude_client.stream_content(**kwargs):
+        chunks.append(text)
+        on_text(text)
+    return ''.join(chunks)
 
-        print(f"\n[API] Researching selected articles...")
 
-        research_results = {}
+def _stream_into(events: queue.Queue, event: str, fn, *args):
+    """
+    Call fn(*args, on_text=...) with each streamed text chunk queued as
+    (event, text), then queue None once fn has finished (or failed)
+    """
+    try:
+        return fn(*args, on_text=lambda text: events.put((event, text)))
+    finally:
+        events.put(None)
 
-        # Research Curious Claims (~350-400 words, storytelling narrative)
-        if curious_claims_topic:
-            safe_print(f"  - Researching Curious Claims: {curious_claims_topic.get('title', 'Unknown')}")
-            claims_style = get_humanization_guidelines('curious_claims')
-            claims_prompt = f"""You are a master storyteller writing for BriteCo Brief, an insurance newsletter for independent agents.
+
+def _research_curious_claims(curious_claims_topic: dict, on_text=None) -> str:
+    """Write the Curious Claims storytelling draft (~350-400 words) for one article"""
+    safe_print(f"  - Researching Curious Claims: {curious_claims_topic.get('title', 'Unknown')}")
+    claims_style = get_humanization_guidelines('curious_claims')
+    claims_prompt = f"""You are a master storyteller writing for BriteCo Brief, an insurance newsletter for independent agents.
 
 Article: {curious_claims_topic.get('title', 'Unknown')}
 Source: {curious_claims_topic.get('url', 'N/A')}
@@ -1903,25 +2483,24 @@ EXAMPLE OPENERS TO EMULATE:
 
 Output the complete story as flowing prose, not as labeled sections."""
 
-            claims_research = claude_client.generate_content(
-                prompt=claims_prompt,
-                model="claude-opus-4-5-20251101",
-                temperature=0.5,
-                max_tokens=800
-            )
-            research_results['curious_claims'] = claims_research['content']
-            print(f"    Curious Claims research: {len(claims_research['content'].split())} words")
+    claims_research = _claude_text(
+        on_text,
+        prompt=claims_prompt,
+        model="claude-opus-4-5-20251101",
+        temperature=0.5,
+        max_tokens=800
+    )
+    print(f"    Curious Claims research: {len(claims_research.split())} words")
+    return claims_research
 
-        # Research News Roundup (5 bullet points, headline-style with hyperlinks)
-        if roundup_topics and len(roundup_topics) > 0:
-            safe_print(f"  - Researching {len(roundup_topics)} roundup articles...")
-            roundup_items = []
-            for topic in roundup_topics[:5]:
-                safe_print(f"    - {topic.get('title', 'Unknown')[:50]}...")
-                source_name = topic.get('publisher', 'Source')
-                url = topic.get('url', '#')
 
-                roundup_prompt = f"""Create a headline-style news bullet for this insurance story (~25-30 words).
+def _research_roundup_item(topic: dict) -> dict:
+    """Write one headline-style roundup bullet (with hyperlink) for an article"""
+    safe_print(f"    - {topic.get('title', 'Unknown')[:50]}...")
+    source_name = topic.get('publisher', 'Source')
+    url = topic.get('url', '#')
+
+    roundup_prompt = f"""Create a headline-style news bullet for this insurance story (~25-30 words).
 
 Article: {topic.get('title', 'Unknown')}
 Summary: {topic.get('description', '')}
@@ -1941,41 +2520,89 @@ Another example:
 
 Output ONLY the bullet text with the embedded hyperlink, nothing else."""
 
-                roundup_result = claude_client.generate_content(
-                    prompt=roundup_prompt,
-                    model="claude-opus-4-5-20251101",
-                    temperature=0.3,
-                    max_tokens=150
-                )
-                roundup_items.append({
-                    'summary': roundup_result['content'].strip(),
-                    'url': url,
-                    'source': source_name
-                })
-            research_results['roundup'] = roundup_items
-            print(f"    Roundup research complete: {len(roundup_items)} items")
-
-        # Use pre-generated InsurNews Spotlight content from Step 2B
-        if spotlight_content:
-            safe_print(f"  - Using pre-generated Spotlight: {spotlight_content.get('subheader', 'Unknown')}")
-            # Pass through the pre-generated spotlight content directly
-            research_results['spotlight'] = spotlight_content
-            print(f"    Spotlight content ready: {spotlight_content.get('subheader', 'No title')}")
+    roundup_result = claude_client.generate_content(
+        prompt=roundup_prompt,
+        model="claude-opus-4-5-20251101",
+        temperature=0.3,
+        max_tokens=150
+    )
+    return {
+        'summary': roundup_result['content'].strip(),
+        'url': url,
+        'source': source_name
+    }
 
-        # Research Agent Advantage Tips (1 article generates intro + 5 tips)
-        # Frontend now passes a single article object, not an array
-        if agent_tips_topics:
-            # Handle both old array format and new single object format
-            if isinstance(agent_tips_topics, list):
-                topic = agent_tips_topics[0] if len(agent_tips_topics) > 0 else None
-            else:
-                topic = agent_tips_topics
 
-            if topic:
-                safe_print(f"  - Generating Agent Advantage from: {topic.get('title', 'Unknown')[:50]}...")
+def _research_roundup(topics: list) -> list:
+    """
+    Write the roundup bullets for all articles in one Claude call that returns
+    a JSON array, instead of one call per article. Returns one item per topic,
+    in order, with None for any bullet missing from the reply (or all of them,
+    if it was cut off or doesn't parse); the caller writes those with
+    _research_roundup_item, fanned out from the request thread.
+    """
+    articles = "".join(f"""
+ARTICLE {i}:
+Article: {topic.get('title', 'Unknown')}
+Summary: {topic.get('description', '')}
+Source: {topic.get('publisher', 'Source')}
+URL: {topic.get('url', '#')}
+""" for i, topic in enumerate(topics, 1))
 
-                tips_style = get_humanization_guidelines('agent_advantage')
-                tips_prompt = f"""Create the "Agent Advantage" section for an insurance agent newsletter based on this article.
+    roundup_prompt = f"""Create a headline-style news bullet (~25-30 words) for each of these {len(topics)} insurance stories.
+{articles}
+FORMAT REQUIREMENTS (for every bullet):
+- Start with a catchy, attention-grabbing phrase
+- Include the key news point
+- Embed a hyperlink to the article: [Source Name](URL), using that article's Source and URL
+- Total ~25-30 words
+
+EXAMPLE BULLETS:
+"Rate hikes hit California hard, and [Insurance Journal](https://insurancejournal.com/article) reports State Farm is leading the charge with a 15% increase affecting 2 million policyholders."
+
+"Big changes for commercial auto, as [PropertyCasualty360](https://propertycasualty360.com/article) reveals new underwriting guidelines that could reshape fleet coverage nationwide."
+
+Return ONLY a JSON array with one object per article, nothing else:
+[{{"index": 1, "bullet": "..."}}, {{"index": 2, "bullet": "..."}}]"""
+
+    roundup_result = claude_client.generate_content(
+        prompt=roundup_prompt,
+        model="claude-opus-4-5-20251101",
+        temperature=0.3,
+        # Each bullet carries a markdown URL plus the JSON wrapping
+        max_tokens=max(800, 200 * len(topics))
+    )
+
+    bullets = {}
+    if roundup_result.get('stop_reason') == 'max_tokens':
+        logger.warning("[Roundup] Batched reply was cut off; writing bullets one by one")
+    else:
+        try:
+            for entry in orjson.loads(strip_code_fence(roundup_result['content'])):
+                bullets[int(entry['index'])] = entry['bullet'].strip()
+        except (orjson.JSONDecodeError, TypeError, KeyError, ValueError, AttributeError) as e:
+            logger.warning("[Roundup] Batched reply didn't parse (%s); writing bullets one by one", e)
+
+    return [
+        {
+            'summary': bullets[i],
+            'url': topic.get('url', '#'),
+            'source': topic.get('publisher', 'Source')
+        } if bullets.get(i) else None
+        for i, topic in enumerate(topics, 1)
+    ]
+
+
+# Start of a numbered Agent Advantage tip ("1. **Title**") at the start of a line
+TIP_NUMBER = re.compile(r'^\d+\.\s*', re.MULTILINE)
+
+
+def _research_agent_tips(topic: dict, on_text=None) -> dict:
+    """Write the Agent Advantage intro + 5 tips from a single source article"""
+    safe_print(f"  - Generating Agent Advantage from: {topic.get('title', 'Unknown')[:50]}...")
+
+    tips_style = get_humanization_guidelines('agent_advantage')
+    tips_prompt = f"""Create the "Agent Advantage" section for an insurance agent newsletter based on this article.
 
 ARTICLE TO DRAW FROM:
 Title: {topic.get('title', 'Unknown')}
@@ -2027,68 +2654,172 @@ Final piece of advice.
 
 Output ONLY the intro and tips in this format, nothing else."""
 
-                tips_result = claude_client.generate_content(
-                    prompt=tips_prompt,
-                    model="claude-opus-4-5-20251101",
-                    temperature=0.4,
-                    max_tokens=800
-                )
+    tips_result = _claude_text(
+        on_text,
+        prompt=tips_prompt,
+        model="claude-opus-4-5-20251101",
+        temperature=0.4,
+        max_tokens=800
+    )
+
+    # Parse the response into intro and tips
+    content = tips_result.strip()
+    intro = ""
+    tips_items = []
+
+    # Extract intro section
+    if '[INTRO]' in content:
+        parts = content.split('[TIPS]')
+        intro_part = parts[0].replace('[INTRO]', '').strip()
+        intro = intro_part
+        tips_part = parts[1].strip() if len(parts) > 1 else ""
+    else:
+        # Fallback: first paragraph is intro
+        lines = content.split('\n\n')
+        intro = lines[0] if lines else ""
+        tips_part = '\n\n'.join(lines[1:]) if len(lines) > 1 else content
+
+    # Parse individual tips: split on the numbers, then take the bold title
+    # off the front of each chunk (chunks without one are skipped)
+    for chunk in TIP_NUMBER.split(tips_part)[1:]:
+        if not chunk.startswith('**'):
+            continue
+        title, closed, body = chunk[2:].partition('**')
+        if not (closed and title.strip() and body.strip()):
+            continue
+        tips_items.append({
+            'title': title.strip(),
+            'tip': body.strip(),
+            'source_url': topic.get('url', '')
+        })
+        if len(tips_items) == 5:
+            break
+
+    # If parsing failed, treat whole content as tips
+    if not tips_items:
+        tips_items.append({
+            'tip': content,
+            'source_url': topic.get('url', '')
+        })
 
-                # Parse the response into intro and tips
-                content = tips_result['content'].strip()
-                intro = ""
-                tips_items = []
-
-                # Extract intro section
-                if '[INTRO]' in content:
-                    parts = content.split('[TIPS]')
-                    intro_part = parts[0].replace('[INTRO]', '').strip()
-                    intro = intro_part
-                    tips_part = parts[1].strip() if len(parts) > 1 else ""
-                else:
-                    # Fallback: first paragraph is intro
-                    lines = content.split('\n\n')
-                    intro = lines[0] if lines else ""
-                    tips_part = '\n\n'.join(lines[1:]) if len(lines) > 1 else content
-
-                # Parse individual tips (look for numbered items with bold titles)
-                import re
-                tip_pattern = r'\d+\.\s*\*\*(.+?)\*\*\s*\n?(.+?)(?=\n\d+\.|$)'
-                matches = re.findall(tip_pattern, tips_part, re.DOTALL)
-
-                for title, body in matches[:5]:
-                    tips_items.append({
-                        'title': title.strip(),
-                        'tip': body.strip(),
-                        'source_url': topic.get('url', '')
-                    })
+    print(f"    Agent Advantage complete: intro + {len(tips_items)} tips")
+    return {
+        'intro': intro,
+        'tips': tips_items,
+        'source_url': topic.get('url', ''),
+        'source_title': topic.get('title', '')
+    }
 
-                # If parsing failed, treat whole content as tips
-                if not tips_items:
-                    tips_items.append({
-                        'tip': content,
-                        'source_url': topic.get('url', '')
-                    })
 
-                research_results['agent_tips'] = {
-                    'intro': intro,
-                    'tips': tips_items,
-                    'source_url': topic.get('url', ''),
-                    'source_title': topic.get('title', '')
+@app.route('/api/research-articles', methods=['POST'])
+def research_articles():
+    """
+    Research selected articles and produce detailed summaries using GPT.
+    Claims, roundup and Agent Advantage are independent Claude calls, so they
+    run concurrently on IO_POOL and the request takes as long as the slowest one.
+
+    With "stream": true the response is server-sent events instead: the Claims
+    story and Agent Advantage text arrive as claims_delta / tips_delta frames
+    while they're written, then a "done" event carries the usual JSON payload.
+    """
+    req = ResearchArticlesRequest.model_validate_json(request.get_data() or b'{}')
+    try:
+        curious_claims_topic = req.curious_claims_topic
+        roundup_topics = req.roundup_topics
+        spotlight_content = req.spotlight_content
+        agent_tips_topics = req.agent_tips_topics
+
+        print(f"\n[API] Researching selected articles...")
+
+        research_results = {}
+        pending = {}
+        events = queue.Queue() if req.stream else None
+
+        def submit_streamable(fn, topic, event):
+            if events is None:
+                return IO_POOL.submit(fn, topic)
+            return IO_POOL.submit(_stream_into, events, event, fn, topic)
+
+        # Research Curious Claims (~350-400 words, storytelling narrative)
+        if curious_claims_topic:
+            pending['curious_claims'] = submit_streamable(_research_curious_claims, curious_claims_topic, 'claims_delta')
+
+        # Research News Roundup (5 bullet points, headline-style with hyperlinks),
+        # all written by one batched Claude call
+        if roundup_topics and len(roundup_topics) > 0:
+            safe_print(f"  - Researching {len(roundup_topics)} roundup articles...")
+            pending['roundup'] = IO_POOL.submit(_research_roundup, roundup_topics[:5])
+
+        # Research Agent Advantage Tips (1 article generates intro + 5 tips)
+        # Frontend now passes a single article object, not an array
+        if agent_tips_topics:
+            # Handle both old array format and new single object format
+            if isinstance(agent_tips_topics, list):
+                topic = agent_tips_topics[0] if len(agent_tips_topics) > 0 else None
+            else:
+                topic = agent_tips_topics
+
+            if topic:
+                pending['agent_tips'] = submit_streamable(_research_agent_tips, topic, 'tips_delta')
+
+        # Use pre-generated InsurNews Spotlight content from Step 2B
+        if spotlight_content:
+            safe_print(f"  - Using pre-generated Spotlight: {spotlight_content.get('subheader', 'Unknown')}")
+            # Pass through the pre-generated spotlight content directly
+            research_results['spotlight'] = spotlight_content
+            print(f"    Spotlight content ready: {spotlight_content.get('subheader', 'No title')}")
+
+        def collect():
+            # Wait for the concurrent sections (result() re-raises any failure)
+            for key, future in pending.items():
+                research_results[key] = future.result()
+            if 'roundup' in research_results:
+                # Bullets the batched call didn't deliver get their own calls,
+                # submitted from here so they run in parallel
+                roundup = research_results['roundup']
+                fallbacks = {
+                    i: IO_POOL.submit(_research_roundup_item, topic)
+                    for i, (topic, item) in enumerate(zip(roundup_topics, roundup)) if item is None
                 }
-                print(f"    Agent Advantage complete: intro + {len(tips_items)} tips")
+                for i, future in fallbacks.items():
+                    roundup[i] = future.result()
+                print(f"    Roundup research complete: {len(research_results['roundup'])} items")
 
-        print(f"[API] Research complete")
+            print(f"[API] Research complete")
+            return {
+                'success': True,
+                'research': research_results,
+                'generated_at': datetime.now().isoformat()
+            }
 
-        return jsonify({
-            'success': True,
-            'research': research_results,
-            'generated_at': datetime.now().isoformat()
-        })
+        if events is None:
+            return jsonify(collect())
+
+        def generate():
+            # Each streamed section queues None when it finishes
+            open_streams = sum(key != 'roundup' for key in pending)
+            while open_streams:
+                item = events.get()
+                if item is None:
+                    open_streams -= 1
+                    continue
+                event, text = item
+                yield f"event: {event}\ndata: {orjson.dumps(text).decode('utf-8')}\n\n"
+            try:
+                done = collect()
+            except Exception as e:
+                print(f"[API ERROR] Research stream: {e}")
+                done = {'success': False, 'error': str(e)}
+            yield f"event: done\ndata: {orjson.dumps(done).decode('utf-8')}\n\n"
+
+        return Response(
+            stream_with_context(generate()),
+            mimetype='text/event-stream',
+            headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+        )
 
     except Exception as e:
         print(f"[API ERROR] Research failed: {str(e)}")
-        import traceback
         traceback.print_exc()
         return jsonify({'success': False, 'error': str(e)}), 500
 
@@ -2101,12 +2832,12 @@ def generate_content():
     """
     Generate newsletter content using Claude Opus 4.5.
     """
+    req = GenerateContentRequest.model_validate_json(request.get_data() or b'{}')
     try:
-        data = request.json
-        month = data.get('month', 'january')
-        research = data.get('research')
-        brite_spot_topic = data.get('brite_spot_topic', '')
-        intro_content = data.get('intro_content', '')
+        month = req.month
+        research = req.research
+        brite_spot_topic = req.brite_spot_topic
+        intro_content = req.intro_content
 
         if not research:
             return jsonify({'success': False, 'error': 'Research data required'}), 400
@@ -2117,6 +2848,7 @@ def generate_content():
             raise ValueError("Claude client not available for writing")
 
         sections = {}
+        pending = {}  # section key -> Future for the Claude calls below
         style_guide = get_style_guide_for_prompt()
 
         # Generate Introduction (1-4 sentences, ~75 words)
@@ -2141,13 +2873,13 @@ Requirements:
 
 Output ONLY the introduction text, no labels or formatting."""
 
-            intro_result = claude_client.generate_content(
+            pending['introduction'] = IO_POOL.submit(
+                claude_client.generate_content,
                 prompt=intro_prompt,
                 model="claude-opus-4-5-20251101",
                 temperature=0.5,
                 max_tokens=150
             )
-            sections['introduction'] = intro_result['content'].strip()
 
         # Generate Brite Spot (max 100 words)
         if brite_spot_topic:
@@ -2176,13 +2908,13 @@ WRITING STYLE:
 
 Output ONLY the Brite Spot text, no title or labels."""
 
-            brite_spot_result = claude_client.generate_content(
+            pending['brite_spot'] = IO_POOL.submit(
+                claude_client.generate_content,
                 prompt=brite_spot_prompt,
                 model="claude-opus-4-5-20251101",
                 temperature=0.4,
                 max_tokens=200
             )
-            sections['brite_spot'] = brite_spot_result['content'].strip()
 
         # Generate Curious Claims from research
         if research.get('curious_claims'):
@@ -2230,13 +2962,17 @@ OUTPUT FORMAT:
 
 Output ONLY the paragraphs in <p> tags, no title or labels."""
 
-            claims_result = claude_client.generate_content(
+            pending['curious_claims'] = IO_POOL.submit(
+                claude_client.generate_content,
                 prompt=claims_prompt,
                 model="claude-opus-4-5-20251101",
                 temperature=0.4,
                 max_tokens=400
             )
-            sections['curious_claims'] = claims_result['content'].strip()
+
+        # The three Claude sections are independent - wait for them together
+        for key, future in pending.items():
+            sections[key] = future.result()['content'].strip()
 
         # News Roundup is already formatted as bullet points from research
         if research.get('roundup'):
@@ -2274,7 +3010,6 @@ Output ONLY the paragraphs in <p> tags, no title or labels."""
 
     except Exception as e:
         print(f"[API ERROR] Content generation failed: {str(e)}")
-        import traceback
         traceback.print_exc()
         return jsonify({'success': False, 'error': str(e)}), 500
 
@@ -2282,25 +3017,8 @@ Output ONLY the paragraphs in <p> tags, no title or labels."""
 # ROUTES - IMAGE GENERATION
 # ============================================================================
 
-@app.route('/api/generate-image-prompts', methods=['POST'])
-def generate_image_prompts():
-    """Generate image prompts for newsletter sections"""
-    try:
-        data = request.json
-        sections = data.get('sections', {})
-        month = data.get('month', 'january')
-
-        print(f"\n[API] Generating image prompts for {len(sections)} sections...")
-
-        prompts = {}
-
-        for section_name, section_data in sections.items():
-            print(f"  - Creating image prompt for {section_name}")
-
-            title = section_data.get('title', '')
-            content = section_data.get('content', '')[:400]
-
-            prompt_request = f"""Create a text-to-image prompt for an insurance newsletter image.
+# Claude request for a section's text-to-image prompt; only the section fields vary
+IMAGE_PROMPT_REQUEST_TEMPLATE = """Create a text-to-image prompt for an insurance newsletter image.
 
 Section: {section_name}
 Title: "{title}"
@@ -2316,15 +3034,83 @@ Requirements:
 
 Output ONLY the image generation prompt, nothing else."""
 
-            prompt_result = claude_client.generate_content(
-                prompt=prompt_request,
+# The same request for every section at once, answered as one JSON object
+IMAGE_PROMPT_BATCH_TEMPLATE = """Create a text-to-image prompt for each of these insurance newsletter sections.
+{sections}
+Requirements (for every prompt):
+- Photorealistic, professional photography style (NOT cartoon, NOT illustration, NOT digital art)
+- Stock photo aesthetic - like images from Shutterstock or Getty Images
+- Blue/teal color accents where appropriate (BriteCo brand colors)
+- No text overlays in the image
+- Suitable for professional email newsletter
+- Clean, well-lit, high-quality photography look
+
+Return ONLY a JSON object mapping each section name to its image generation prompt, nothing else:
+{{"section_name": "image prompt", ...}}"""
+
+
+def _image_prompt_for_section(section_name: str, title: str, content: str) -> str:
+    """Ask Claude for one section's image prompt (fallback for the batched request)"""
+    prompt_result = claude_client.generate_content(
+        prompt=IMAGE_PROMPT_REQUEST_TEMPLATE.format(section_name=section_name, title=title, content=content),
+        model="claude-opus-4-5-20251101",
+        temperature=0.5,
+        max_tokens=150,
+        use_cache=False  # A repeat request means "give me another take"
+    )
+    return prompt_result['content'].strip()
+
+
+@app.route('/api/generate-image-prompts', methods=['POST'])
+def generate_image_prompts():
+    """Generate image prompts for newsletter sections"""
+    try:
+        data = request.json
+        sections = data.get('sections', {})
+        month = data.get('month', 'january')
+
+        print(f"\n[API] Generating image prompts for {len(sections)} sections...")
+
+        fields = {
+            section_name: (section_data.get('title', ''), section_data.get('content', '')[:400])
+            for section_name, section_data in sections.items()
+        }
+
+        # One Claude call writes every section's prompt
+        generated = {}
+        if fields:
+            section_blocks = "".join(f"""
+Section: {section_name}
+Title: "{title}"
+Content: "{content}..."
+""" for section_name, (title, content) in fields.items())
+            batch_result = claude_client.generate_content(
+                prompt=IMAGE_PROMPT_BATCH_TEMPLATE.format(sections=section_blocks),
                 model="claude-opus-4-5-20251101",
                 temperature=0.5,
-                max_tokens=150
+                max_tokens=150 * len(fields),
+                use_cache=False  # A repeat request means "give me another take"
             )
+            try:
+                parsed = orjson.loads(strip_code_fence(batch_result['content']))
+                generated = {
+                    name: text.strip() for name, text in parsed.items()
+                    if name in fields and isinstance(text, str) and text.strip()
+                }
+            except (orjson.JSONDecodeError, AttributeError) as e:
+                logger.warning("[Image Prompts] Batched reply didn't parse (%s); writing prompts one by one", e)
 
+        # Any section the batch missed gets its own call (concurrently)
+        missing = {
+            section_name: IO_POOL.submit(_image_prompt_for_section, section_name, title, content)
+            for section_name, (title, content) in fields.items() if section_name not in generated
+        }
+
+        prompts = {}
+        for section_name, (title, content) in fields.items():
+            print(f"  - Created image prompt for {section_name}")
             prompts[section_name] = {
-                'prompt': prompt_result['content'].strip(),
+                'prompt': generated[section_name] if section_name in generated else missing[section_name].result(),
                 'title': title
             }
 
@@ -2355,7 +3141,7 @@ def generate_image():
         safe_print(f"  Prompt: {prompt[:100]}...")
 
         # Generate image using Gemini
-        result = gemini_client.generate_image(
+        result = get_gemini_client().generate_image(
             prompt=prompt,
             aspect_ratio="16:9"
         )
@@ -2379,126 +3165,190 @@ def generate_image():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
-@app.route('/api/generate-images', methods=['POST'])
-def generate_images():
-    """Generate images for newsletter sections using provided or auto-generated prompts (matches venue-voice)"""
-    try:
-        data = request.json
-        sections = data.get('sections', {})
-        prompts = data.get('prompts', {})  # Pre-generated or user-edited prompts
+# Encoders for the final newsletter images: (PIL format, save kwargs, MIME subtype).
+# JPEG is the default because the images end up in email, where WebP support is
+# patchy (Outlook); WebP is available for in-app previews.
+IMAGE_OUTPUT_FORMATS = {
+    'jpeg': ('JPEG', {'quality': 85, 'progressive': True, 'optimize': True}, 'jpeg'),
+    'webp': ('WEBP', {'quality': 82, 'method': 4}, 'webp'),
+    'png': ('PNG', {'compress_level': 1}, 'png'),
+}
 
-        print(f"\n[API] Generating images with Nano Banana (Gemini)...")
-        print(f"[API] Received {len(prompts)} prompts")
 
-        # Check if Gemini is available
-        if not gemini_client or not gemini_client.is_available():
-            return jsonify({
-                'success': False,
-                'error': 'Gemini API not configured. Please add GOOGLE_AI_API_KEY to your .env file. Get a key from https://aistudio.google.com/app/apikey'
-            }), 503
+def _generate_section_image(section_name: str, prompt: str, output_format: str) -> str:
+    """Generate, resize and re-encode one section image; returns a data URL ('' on failure)"""
+    pil_format, save_options, mime_subtype = IMAGE_OUTPUT_FORMATS[output_format]
 
-        images = {}
+    safe_print(f"  [{section_name.upper()}] Prompt: {prompt[:80]}...")
 
-        # Generate image for each prompt
-        for section_name, prompt in prompts.items():
-            safe_print(f"  [{section_name.upper()}] Prompt: {prompt[:80]}...")
+    # Determine aspect ratio based on section
+    # briteSpot/claims: larger images - use 16:9 landscape
+    # spotlight/tips: can be 1:1 square
+    if section_name in ['briteSpot', 'claims']:
+        aspect_ratio = "16:9"  # Landscape for larger images
+    else:
+        aspect_ratio = "1:1"  # Square for other images
 
-            # Determine aspect ratio based on section
-            # briteSpot/claims: larger images - use 16:9 landscape
-            # spotlight/tips: can be 1:1 square
-            if section_name in ['briteSpot', 'claims']:
-                aspect_ratio = "16:9"  # Landscape for larger images
-            else:
-                aspect_ratio = "1:1"  # Square for other images
+    # Generate with Gemini (Nano Banana)
+    print(f"  [{section_name.upper()}] Calling Nano Banana...")
+    image_result = get_gemini_client().generate_image(
+        prompt=prompt,
+        aspect_ratio=aspect_ratio
+    )
 
-            # Generate with Gemini (Nano Banana)
-            print(f"  [{section_name.upper()}] Calling Nano Banana...")
-            image_result = gemini_client.generate_image(
-                prompt=prompt,
-                aspect_ratio=aspect_ratio
-            )
+    # Get the base64 image data (Gemini returns PNG)
+    image_data = image_result.get('image_base64', image_result.get('image_data', ''))
+    image_mime = 'png'
 
-            # Get the base64 image data
-            image_data = image_result.get('image_base64', image_result.get('image_data', ''))
+    # Resize image to exact newsletter dimensions
+    if image_data:
+        try:
+            # Use the raw PNG when the client provides it rather than decoding base64
+            image_bytes = image_result.get('image_bytes') or base64.b64decode(image_data)
+
+            # Section-specific image sizes
+            if section_name == 'spotlight':
+                # Full-width banner for InsureNews Spotlight (below title, 25% shorter)
+                target_width = 490
+                target_height = 263
+            else:
+                # Square images for other sections (180x180)
+                target_width = 180
+                target_height = 180
+
+            # Center crop to the target aspect and resize in one pass, so
+            # LANCZOS only runs over the pixels that survive the crop. The full
+            # size decode is released as soon as the small copy exists.
+            with Image.open(BytesIO(image_bytes)) as pil_image:
+                print(f"  [{section_name.upper()}] Resizing from {pil_image.size} to {target_width}x{target_height}...")
+                # A JPEG source can decode at a reduced DCT scale (PNG ignores
+                # this), then a whole-factor box reduce brings any format down to
+                # no less than twice the target before the LANCZOS pass
+                pil_image.draft('RGB', (target_width * 2, target_height * 2))
+                factor = min(pil_image.width // (target_width * 2), pil_image.height // (target_height * 2))
+                source_image = pil_image.reduce(factor) if factor > 1 else pil_image
+                resized_image = ImageOps.fit(
+                    source_image,
+                    (target_width, target_height),
+                    method=Image.Resampling.LANCZOS,
+                    centering=(0.5, 0.5)
+                )
 
-            # Resize image to exact newsletter dimensions
-            if image_data:
-                try:
-                    from PIL import Image
+            # Re-encode in the requested format and convert back to base64
+            if pil_format == 'JPEG' and resized_image.mode != 'RGB':
+                resized_image = resized_image.convert('RGB')
+            buffer = BytesIO()
+            resized_image.save(buffer, format=pil_format, **save_options)
+            image_data = base64.b64encode(buffer.getbuffer()).decode('ascii')
+            image_mime = mime_subtype
 
-                    # Decode base64 to PIL Image
-                    image_bytes = base64.b64decode(image_data)
-                    pil_image = Image.open(BytesIO(image_bytes))
+            print(f"  [{section_name.upper()}] Resized successfully to {target_width}x{target_height}")
 
-                    # Section-specific image sizes
-                    if section_name == 'spotlight':
-                        # Full-width banner for InsureNews Spotlight (below title, 25% shorter)
-                        target_width = 490
-                        target_height = 263
-                    else:
-                        # Square images for other sections (180x180)
-                        target_width = 180
-                        target_height = 180
+        except Exception as resize_error:
+            print(f"  [{section_name.upper()}] Resize failed, using original: {resize_error}")
 
-                    print(f"  [{section_name.upper()}] Resizing from {pil_image.size} to {target_width}x{target_height}...")
+    print(f"  [{section_name.upper()}] SUCCESS - Image generated ({len(image_data) if image_data else 0} bytes)")
 
-                    # Calculate aspect ratios
-                    img_aspect = pil_image.width / pil_image.height
-                    target_aspect = target_width / target_height
+    # Convert to data URL for frontend display
+    return f"data:image/{image_mime};base64,{image_data}" if image_data else ''
 
-                    # Resize maintaining aspect ratio, then crop to exact size
-                    if img_aspect > target_aspect:
-                        # Image is wider - resize based on height, then crop width
-                        new_height = target_height
-                        new_width = int(target_height * img_aspect)
-                    else:
-                        # Image is taller - resize based on width, then crop height
-                        new_width = target_width
-                        new_height = int(target_width / img_aspect)
 
-                    # Resize maintaining aspect ratio
-                    resized_temp = pil_image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+def _generate_images_for_prompts(prompts: dict, output_format: str) -> dict:
+    """Generate every section image concurrently; shared by the sync and background paths"""
+    futures = {
+        section_name: IMAGE_POOL.submit(_generate_section_image, section_name, prompt, output_format)
+        for section_name, prompt in prompts.items()
+    }
+    images = {section_name: future.result() for section_name, future in futures.items()}
 
-                    # Center crop to exact target dimensions
-                    left = (new_width - target_width) // 2
-                    top = (new_height - target_height) // 2
-                    right = left + target_width
-                    bottom = top + target_height
+    print(f"[API] Generated {len(images)} images")
 
-                    resized_image = resized_temp.crop((left, top, right, bottom))
+    return {
+        'images': images,
+        'generated_at': datetime.now().isoformat()
+    }
 
-                    # Convert back to base64
-                    buffer = BytesIO()
-                    resized_image.save(buffer, format='PNG', optimize=True)
-                    resized_bytes = buffer.getvalue()
-                    image_data = base64.b64encode(resized_bytes).decode('utf-8')
 
-                    print(f"  [{section_name.upper()}] Resized successfully to {target_width}x{target_height}")
+@app.route('/api/generate-images', methods=['POST'])
+def generate_images():
+    """
+    Generate images for newsletter sections using provided or auto-generated prompts (matches venue-voice)
 
-                except Exception as resize_error:
-                    print(f"  [{section_name.upper()}] Resize failed, using original: {resize_error}")
+    Pass "async": true to get back a job id immediately and poll
+    /api/image-status/<job_id> instead of holding the request open.
+    """
+    req = GenerateImagesRequest.model_validate_json(request.get_data() or b'{}')
+    try:
+        prompts = req.prompts
+        output_format = (req.format or request.args.get('format') or 'jpeg').lower()
+        if output_format not in IMAGE_OUTPUT_FORMATS:
+            output_format = 'jpeg'
 
-            # Convert to data URL for frontend display
-            image_url = f"data:image/png;base64,{image_data}" if image_data else ''
+        print(f"\n[API] Generating images with Nano Banana (Gemini)...")
+        print(f"[API] Received {len(prompts)} prompts")
 
-            images[section_name] = image_url
-            print(f"  [{section_name.upper()}] SUCCESS - Image generated ({len(image_data) if image_data else 0} bytes)")
+        # Check if Gemini is available
+        if not get_gemini_client().is_available():
+            return jsonify({
+                'success': False,
+                'error': 'Gemini API not configured. Please add GOOGLE_AI_API_KEY to your .env file. Get a key from https://aistudio.google.com/app/apikey'
+            }), 503
 
-        print(f"[API] Generated {len(images)} images")
+        if req.run_async:
+            job_id = IMAGE_JOBS.submit(_generate_images_for_prompts, prompts, output_format)
+            print(f"[API] Image job {job_id} queued")
+            return jsonify({
+                'success': True,
+                'job_id': job_id,
+                'status_url': f"/api/image-status/{job_id}"
+            }), 202
 
-        return jsonify({
-            'success': True,
-            'images': images,
-            'generated_at': datetime.now().isoformat()
-        })
+        return jsonify({'success': True, **_generate_images_for_prompts(prompts, output_format)})
 
     except Exception as e:
         print(f"[API ERROR] {str(e)}")
-        import traceback
         traceback.print_exc()
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+@app.route('/api/image-status/<job_id>', methods=['GET'])
+def image_status(job_id):
+    """Poll a background image job started by /api/generate-images"""
+    job = IMAGE_JOBS.status(job_id)
+    if job is None:
+        return jsonify({'success': False, 'error': 'Unknown or expired job'}), 404
+
+    if not job['done']:
+        return jsonify({'success': True, 'done': False})
+
+    if 'error' in job:
+        print(f"[API ERROR] Image job {job_id} failed: {job['error']}")
+        return jsonify({'success': False, 'done': True, 'error': job['error']}), 500
+
+    return jsonify({'success': True, 'done': True, **job['result']})
+
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def job_status(job_id):
+    """Poll any background job (brand check, preview send or image job)"""
+    for registry in (BACKGROUND_JOBS, IMAGE_JOBS):
+        job = registry.status(job_id)
+        if job is not None:
+            break
+    else:
+        return jsonify({'success': False, 'error': 'Unknown or expired job'}), 404
+
+    if not job['done']:
+        return jsonify({'success': True, 'done': False})
+
+    if 'error' in job:
+        print(f"[API ERROR] Job {job_id} failed: {job['error']}")
+        return jsonify({'success': False, 'done': True, 'error': job['error']}), 500
+
+    # The job's own 'success' (e.g. a preview that reached nobody) wins
+    return jsonify({'success': True, 'done': True, **job['result']})
+
+
 # ============================================================================
 # ROUTES - HEADLINES & INTRO
 # ============================================================================
@@ -2530,7 +3380,9 @@ Requirements:
 
 Output ONLY the subject line, nothing else."""
 
-        subject_result = claude_client.generate_content(
+        # The preview text doesn't depend on the subject line, so both calls run at once
+        subject_future = IO_POOL.submit(
+            claude_client.generate_content,
             prompt=subject_prompt,
             model="claude-opus-4-5-20251101",
             temperature=0.6,
@@ -2553,6 +3405,7 @@ Output ONLY the preview text, nothing else."""
             temperature=0.5,
             max_tokens=60
         )
+        subject_result = subject_future.result()
 
         print(f"[API] Headlines generated")
 
@@ -2616,7 +3469,8 @@ Output EXACTLY 4 subject lines, one per line, numbered 1-4. No other text."""
             prompt=subject_prompt,
             model="claude-opus-4-5-20251101",
             temperature=0.7,
-            max_tokens=300
+            max_tokens=300,
+            use_cache=False  # A repeat request means "give me another take"
         )
 
         # Parse subject lines
@@ -2625,7 +3479,7 @@ Output EXACTLY 4 subject lines, one per line, numbered 1-4. No other text."""
             line = line.strip()
             if line:
                 # Remove numbering like "1." or "1)" from start
-                cleaned = re.sub(r'^[\d]+[\.\)]\s*', '', line)
+                cleaned = LIST_NUMBER_PREFIX.sub('', line)
                 if cleaned:
                     subject_lines.append(cleaned)
 
@@ -2655,7 +3509,8 @@ Output EXACTLY 4 preheader options, one per line, numbered 1-4. No other text.""
             prompt=preheader_prompt,
             model="claude-opus-4-5-20251101",
             temperature=0.7,
-            max_tokens=400
+            max_tokens=400,
+            use_cache=False  # A repeat request means "give me another take"
         )
 
         # Parse preheaders
@@ -2663,7 +3518,7 @@ Output EXACTLY 4 preheader options, one per line, numbered 1-4. No other text.""
         for line in preheader_result['content'].strip().split('\n'):
             line = line.strip()
             if line:
-                cleaned = re.sub(r'^[\d]+[\.\)]\s*', '', line)
+                cleaned = LIST_NUMBER_PREFIX.sub('', line)
                 if cleaned:
                     preheaders.append(cleaned)
 
@@ -2695,38 +3550,9 @@ Output EXACTLY 4 preheader options, one per line, numbered 1-4. No other text.""
 # ROUTES - BRAND CHECK
 # ============================================================================
 
-@app.route('/api/brand-check', methods=['POST'])
-def brand_check():
-    """Check newsletter content against brand guidelines - returns structured JSON suggestions"""
-    try:
-        data = request.json
-        claims_content = data.get('claims_content', '')
-        roundup_content = data.get('roundup_content', '')
-        spotlight_content = data.get('spotlight_content', '')
-        tips_content = data.get('tips_content', '')
-        brite_spot_content = data.get('brite_spot_content', '')
-
-        print(f"\n[API] Running brand check...")
-
-        # Combine all content for checking
-        full_content = f"""
-BRITE SPOT SECTION:
-{brite_spot_content}
-
-CURIOUS CLAIMS SECTION:
-{claims_content}
-
-NEWS ROUNDUP SECTION:
-{roundup_content}
-
-INSURNEWS SPOTLIGHT SECTION:
-{spotlight_content}
-
-AGENT ADVANTAGE SECTION:
-{tips_content}
-"""
-
-        check_prompt = f"""You are a brand consistency checker for BriteCo Brief, an insurance agent newsletter, using BriteCo's Editorial Style Guide.
+# Static brand-check instructions, sent as a cached system prompt; only the
+# newsletter content changes between calls
+BRAND_CHECK_RUBRIC = """You are a brand consistency checker for BriteCo Brief, an insurance agent newsletter, using BriteCo's Editorial Style Guide.
 
 BRAND GUIDELINES TO CHECK:
 
@@ -2770,79 +3596,469 @@ Review the following newsletter content and identify SPECIFIC phrases that need
 IMPORTANT: Skip over hyperlinks and URLs - do not flag them as issues. Hyperlinks in formats like [text](url) or <a href="...">text</a> should be left as-is.
 
 Return a JSON object with an array of suggested changes:
-{{
+{
     "suggestions": [
-        {{
+        {
             "section": "claims" | "roundup" | "spotlight" | "tips" | "brite_spot",
             "issue": "Brief description of the issue (e.g., 'Non-P&C content', 'Missing serial comma', 'Incorrect BriteCo terminology')",
             "original": "exact phrase from content that needs changing",
             "suggested": "what it should be changed to",
             "reason": "why this change is needed per brand guidelines"
-        }}
+        }
     ]
-}}
+}
+
+Only include items that actually need to be changed. If the content is perfect, return an empty suggestions array."""
+
+
+def _brand_check_content(req: BrandCheckRequest) -> str:
+    """Combine the newsletter sections into the text the brand check reviews"""
+    return f"""
+BRITE SPOT SECTION:
+{req.brite_spot_content}
+
+CURIOUS CLAIMS SECTION:
+{req.claims_content}
+
+NEWS ROUNDUP SECTION:
+{req.roundup_content}
+
+INSURNEWS SPOTLIGHT SECTION:
+{req.spotlight_content}
+
+AGENT ADVANTAGE SECTION:
+{req.tips_content}
+"""
+
+
+def _brand_check_key(req: BrandCheckRequest) -> str:
+    """Cache key / batch custom_id for a set of sections (ignores request options)"""
+    return make_cache_key(req.model_dump(exclude={'run_async'}))
+
+
+# What _brand_check_key produces (a make_cache_key digest), and the prefix of
+# Anthropic Message Batch ids; brand-check batch polls accept nothing else
+BRAND_CHECK_KEY_FORMAT = re.compile(r'[0-9a-f]{32}')
+BATCH_ID_PREFIX = 'msgbatch_'
+
+
+def _brand_check_prompt(full_content: str) -> str:
+    return f"""CONTENT TO REVIEW:
+{full_content}
+
+Return ONLY the JSON."""
+
+
+def _parse_brand_check(response_text: str):
+    """Parse and validate the model's JSON verdict; None if no valid verdict is found"""
+    check_text = strip_code_fence(response_text)
+    try:
+        return BrandCheckResult.model_validate_json(check_text).model_dump()
+    except ValidationError as e:
+        error = e
 
-Only include items that actually need to be changed. If the content is perfect, return an empty suggestions array.
+    # Near-JSON with prose around it: retry on the outermost {...}
+    start, end = check_text.find('{'), check_text.rfind('}')
+    if 0 <= start < end:
+        try:
+            return BrandCheckResult.model_validate_json(check_text[start:end + 1]).model_dump()
+        except ValidationError as e:
+            error = e
+
+    print(f"[API WARNING] Failed to parse brand check JSON: {error.errors()[0]['msg']}")
+    print(f"[API WARNING] Raw response: {check_text[:200]}")
+    return None
+
+
+def _run_brand_check(req: BrandCheckRequest, use_cache: bool = True) -> dict:
+    """Review one set of sections (cache tiers, then Claude); returns the response body"""
+    full_content = _brand_check_content(req)
+
+    cache_key = _brand_check_key(req)
+    embedding = None
+    check_results = BRAND_CHECK_CACHE.get(cache_key) if use_cache else None
+    if check_results is None and use_cache and BRAND_CHECK_SEMANTIC_CACHE is not None:
+        embedding = BRAND_CHECK_SEMANTIC_CACHE.embed(full_content)
+        check_results = BRAND_CHECK_SEMANTIC_CACHE.get(embedding)
+        if check_results is not None:
+            # A near-duplicate's verdict: keep only suggestions whose phrase
+            # still appears, since the frontend applies them by find/replace
+            check_results['suggestions'] = [
+                suggestion for suggestion in check_results.get('suggestions', [])
+                if suggestion.get('original', '') in full_content
+            ]
 
-CONTENT TO REVIEW:
-{full_content}"""
+    cached = check_results is not None
+    if cached:
+        print(f"[API] Brand check served from cache")
+    else:
+        print(f"\n[API] Running brand check...")
 
         check_result = claude_client.generate_content(
-            prompt=check_prompt,
+            prompt=_brand_check_prompt(full_content),
+            system_prompt=BRAND_CHECK_RUBRIC,
+            cache_system_prompt=True,
             model="claude-opus-4-5-20251101",
             temperature=0.2,
-            max_tokens=1500
+            max_tokens=1500,
+            # BRAND_CHECK_CACHE holds parsed verdicts; the client cache would
+            # also keep an unparseable reply and hand it back on the retry
+            use_cache=False
         )
 
-        # Parse the JSON response
-        check_text = check_result['content'].strip()
+        check_results = _parse_brand_check(check_result['content'])
+        if check_results is None:
+            # Fallback if parsing fails (not cached, so a retry asks again)
+            check_results = {"suggestions": []}
+        else:
+            BRAND_CHECK_CACHE.set(cache_key, check_results)
+            if BRAND_CHECK_SEMANTIC_CACHE is not None:
+                if embedding is None:
+                    embedding = BRAND_CHECK_SEMANTIC_CACHE.embed(full_content)
+                BRAND_CHECK_SEMANTIC_CACHE.set(embedding, check_results)
+
+    num_suggestions = len(check_results.get('suggestions', []))
+    passed = num_suggestions == 0
+
+    print(f"[API] Brand check complete - {num_suggestions} suggestions found")
+
+    return {
+        'success': True,
+        'passed': passed,
+        'check_results': check_results,
+        'generated_at': datetime.now().isoformat(),
+        'cached': cached
+    }
 
-        # Remove markdown code blocks if present
-        if check_text.startswith('```'):
-            check_text = check_text.split('```')[1]
-            if check_text.startswith('json'):
-                check_text = check_text[4:]
-            check_text = check_text.strip()
 
-        try:
-            check_results = json.loads(check_text)
-        except json.JSONDecodeError as e:
-            print(f"[API WARNING] Failed to parse brand check JSON: {e}")
-            print(f"[API WARNING] Raw response: {check_text[:200]}")
-            # Fallback if parsing fails
-            check_results = {"suggestions": []}
+@app.route('/api/brand-check', methods=['POST'])
+def brand_check():
+    """
+    Check newsletter content against brand guidelines - returns structured JSON suggestions
 
-        num_suggestions = len(check_results.get('suggestions', []))
-        passed = num_suggestions == 0
+    Pass "async": true to get a job id back immediately and poll /api/jobs/<job_id>.
+    """
+    req = BrandCheckRequest.model_validate_json(request.get_data() or b'{}')
+    try:
+        # ?no_cache=1 forces a fresh review
+        use_cache = not request.args.get('no_cache')
 
-        print(f"[API] Brand check complete - {num_suggestions} suggestions found")
+        if req.run_async:
+            job_id = BACKGROUND_JOBS.submit(_run_brand_check, req, use_cache)
+            print(f"[API] Brand check job {job_id} queued")
+            return jsonify({'success': True, 'job_id': job_id, 'status_url': f"/api/jobs/{job_id}"}), 202
 
-        return jsonify({
-            'success': True,
-            'passed': passed,
-            'check_results': check_results,
-            'generated_at': datetime.now().isoformat()
-        })
+        return jsonify(_run_brand_check(req, use_cache))
 
+    except RateLimitExceeded:
+        raise
     except Exception as e:
         print(f"[API ERROR] Brand check failed: {str(e)}")
-        import traceback
         traceback.print_exc()
         return jsonify({'success': False, 'error': str(e)}), 500
 
+
+def _brand_check_batch_results(results: dict) -> dict:
+    """Response body entries for custom_id -> parsed verdict (None if the check failed)"""
+    return {
+        custom_id: None if check_results is None else {
+            'passed': not check_results.get('suggestions'),
+            'check_results': check_results
+        }
+        for custom_id, check_results in results.items()
+    }
+
+
+@app.route('/api/brand-check-batch', methods=['POST'])
+def brand_check_batch():
+    """
+    Queue brand checks for several drafts through the Anthropic Batches API
+
+    Batches cost half as much but can take minutes to hours. Payloads with a
+    cached verdict are answered in this response; the rest go into one batch
+    whose Anthropic batch id is returned along with a status_url
+    (/api/brand-check-batch/<batch_id>?custom_ids=...) naming the custom_ids
+    the poll will fill in. Results are keyed by the custom_ids returned here
+    (one per payload, in order); a null result means that payload's check failed.
+    """
+    req = BrandCheckBatchRequest.model_validate_json(request.get_data() or b'{}')
+    if not req.payloads:
+        return jsonify({'success': False, 'error': 'payloads required'}), 400
+    if not claude_client:
+        return jsonify({'success': False, 'error': 'Claude client not available'}), 500
+
+    try:
+        cached = {}
+        prompts = {}
+        for payload in req.payloads:
+            custom_id = _brand_check_key(payload)
+            check_results = BRAND_CHECK_CACHE.get(custom_id)
+            if check_results is not None:
+                cached[custom_id] = check_results
+            elif custom_id not in prompts:
+                prompts[custom_id] = _brand_check_prompt(_brand_check_content(payload))
+
+        print(f"[API] Brand check batch: {len(prompts)} to review, {len(cached)} already cached")
+        body = {
+            'success': True,
+            'custom_ids': [_brand_check_key(payload) for payload in req.payloads],
+            'results': _brand_check_batch_results(cached)
+        }
+        if not prompts:
+            return jsonify({**body, 'done': True, 'generated_at': datetime.now().isoformat()})
+
+        # The batch runs on Anthropic's side; nothing here waits on it, and the
+        # id is all a poll needs, whichever instance it reaches
+        batch_id = claude_client.submit_batch(
+            prompts,
+            system_prompt=BRAND_CHECK_RUBRIC,
+            cache_system_prompt=True,
+            model="claude-opus-4-5-20251101",
+            temperature=0.2,
+            max_tokens=1500
+        )
+        print(f"[API] Brand check batch {batch_id} submitted ({len(prompts)} requests)")
+        return jsonify({
+            **body,
+            'done': False,
+            'batch_id': batch_id,
+            'pending_custom_ids': list(prompts),
+            'status_url': f"/api/brand-check-batch/{batch_id}?custom_ids={','.join(prompts)}"
+        }), 202
+
+    except Exception as e:
+        print(f"[API ERROR] Brand check batch failed: {str(e)}")
+        traceback.print_exc()
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+@app.route('/api/brand-check-batch/<batch_id>', methods=['GET'])
+def brand_check_batch_status(batch_id):
+    """
+    Poll a brand-check batch started by /api/brand-check-batch
+
+    ?custom_ids= (comma-separated, as in the POST's status_url) names the
+    checks to return. Once the batch ends their verdicts go into
+    BRAND_CHECK_CACHE, so later polls are answered without downloading the
+    batch results again.
+    """
+    if not claude_client:
+        return jsonify({'success': False, 'error': 'Claude client not available'}), 500
+
+    custom_ids = [custom_id for custom_id in request.args.get('custom_ids', '').split(',') if custom_id]
+    if not batch_id.startswith(BATCH_ID_PREFIX):
+        return jsonify({'success': False, 'error': 'Invalid batch id'}), 400
+    if not custom_ids or not all(BRAND_CHECK_KEY_FORMAT.fullmatch(custom_id) for custom_id in custom_ids):
+        return jsonify({'success': False, 'error': 'custom_ids required (as returned when the batch was queued)'}), 400
+
+    results = {custom_id: BRAND_CHECK_CACHE.get(custom_id) for custom_id in custom_ids}
+    if any(check_results is None for check_results in results.values()):
+        try:
+            responses = claude_client.batch_results(batch_id)
+        except Exception as e:
+            print(f"[API ERROR] Brand check batch {batch_id} lookup failed: {str(e)}")
+            status = 404 if getattr(e, 'status_code', None) == 404 else 500
+            return jsonify({'success': False, 'error': str(e)}), status
+
+        if responses is None:
+            return jsonify({'success': True, 'done': False})
+
+        for custom_id, check_results in results.items():
+            if check_results is not None:
+                continue
+            text = responses.get(custom_id)
+            check_results = _parse_brand_check(text) if text else None
+            if check_results is not None:
+                BRAND_CHECK_CACHE.set(custom_id, check_results)
+            results[custom_id] = check_results
+
+    return jsonify({
+        'success': True,
+        'done': True,
+        'results': _brand_check_batch_results(results),
+        'generated_at': datetime.now().isoformat()
+    })
+
 # ============================================================================
 # ROUTES - EXPORT & SHARING
 # ============================================================================
 
+def _resolve_html(data: dict):
+    """
+    Return (html, etag) for an export request carrying either "html" or a
+    previously returned "html_etag". html is '' if neither resolves.
+    """
+    html_content = data.get('html', '')
+    if html_content:
+        etag = hashlib.sha256(html_content.encode('utf-8')).hexdigest()[:16]
+        HTML_BLOBS.set(etag, html_content)
+        return html_content, etag
+
+    etag = data.get('html_etag')
+    if etag:
+        html_content = HTML_BLOBS.get(etag)
+        if html_content is None:
+            safe_print(f"[API] HTML etag {etag} not cached (expired or another instance)")
+    return html_content or '', etag
+
+
+def _unknown_etag_response(etag: str):
+    """
+    409 for an html_etag this instance doesn't hold (expired, or issued by
+    another instance); the client should repeat the request with the full "html"
+    """
+    return jsonify({
+        "success": False,
+        "error": "unknown_html_etag",
+        "html_etag": etag
+    }), 409
+
+
+def _send_preview_email(sg, recipient: str, base_body: bytes):
+    """Send the preview to one recipient; returns an error message, or None on success"""
+    try:
+        safe_print(f"[API] Sending to: {recipient}")
+
+        response = sg.send(with_recipients(base_body, [recipient]))
+
+        safe_print(f"[API] SendGrid response status: {response.status_code}")
+
+        if response.status_code in [200, 201, 202]:
+            safe_print(f"[API] Email sent successfully to: {recipient}")
+            return None
+
+        error_msg = f"SendGrid returned status {response.status_code} for {recipient}"
+        safe_print(f"[API] {error_msg}")
+        return error_msg
+
+    except Exception as email_error:
+        error_msg = f"Failed to send to {recipient}: {str(email_error)}"
+        safe_print(f"[API] {error_msg}")
+        # Log more details for debugging
+        if hasattr(email_error, 'body'):
+            safe_print(f"[API] Error body: {email_error.body}")
+        return error_msg
+
+
+def _send_email_to_all(recipients: list, subject: str, html_content: str):
+    """
+    Send one message to every recipient through the shared SendGrid client
+
+    Returns (sent, errors): the recipients reached, in the order given, and
+    an error message per failure.
+    """
+    sg = sendgrid_client
+
+    # Build and serialize the v3 payload (from, subject, HTML) once for the
+    # whole batch; each request only splices in its recipients
+    base_body = orjson.dumps(Mail(
+        from_email=(SENDGRID_FROM_EMAIL, SENDGRID_FROM_NAME),
+        subject=subject,
+        html_content=html_content
+    ).get())
+
+    sent = set()
+    errors = []
+
+    # Everyone gets the same message, so send one request with a personalization
+    # per recipient; SendGrid delivers each as its own email (nobody sees the
+    # other addresses), and the HTML is uploaded once instead of N times
+    failed = set()  # recipients of a bulk request that may have gone out anyway
+    if len(recipients) > 1:
+        for start in range(0, len(recipients), SENDGRID_MAX_PERSONALIZATIONS):
+            chunk = recipients[start:start + SENDGRID_MAX_PERSONALIZATIONS]
+            try:
+                sg.send(with_recipients(base_body, chunk))
+                sent.update(chunk)
+            except Exception as bulk_error:
+                if isinstance(bulk_error, SendGridError) and 400 <= bulk_error.status_code < 500:
+                    # SendGrid rejected the request (e.g. one bad address), so
+                    # nothing went out; the individual sends below report each failure
+                    safe_print(f"[API] Bulk preview send rejected ({bulk_error}); sending individually")
+                else:
+                    # A timeout, dropped connection or 5xx can come after SendGrid
+                    # queued the mail; re-sending could deliver it twice
+                    safe_print(f"[API] Bulk preview send failed: {bulk_error}")
+                    errors.append(f"Send to {len(chunk)} recipient(s) failed: {bulk_error}")
+                    failed.update(chunk)
+        if sent:
+            safe_print(f"[API] Preview sent to {len(sent)} recipients in bulk")
+
+    remaining = [recipient for recipient in recipients if recipient not in sent and recipient not in failed]
+
+    # Send to recipients in parallel; each worker thread takes its own pooled
+    # keep-alive connection from the SendGrid client's session
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(remaining)))) as pool:
+        futures = {
+            pool.submit(_send_preview_email, sg, recipient, base_body): recipient
+            for recipient in remaining
+        }
+        for future in as_completed(futures):
+            error_msg = future.result()
+            if error_msg is None:
+                sent.add(futures[future])
+                continue
+
+            errors.append(error_msg)
+            # On a large batch, stop once a third has failed - the rest won't fare better
+            if len(remaining) >= 30 and len(errors) * 3 >= len(remaining):
+                pool.shutdown(wait=True, cancel_futures=True)
+                not_attempted = sum(1 for f in futures if f.cancelled())
+                safe_print(f"[API] Aborting preview send after {len(errors)} failures")
+                errors.append(f"Aborted after {len(errors)} failures; {not_attempted} recipient(s) not attempted")
+                break
+
+    return [recipient for recipient in recipients if recipient in sent], errors
+
+
+def _send_preview_batch(recipients: list, subject: str, html_content: str) -> dict:
+    """Send the preview to every recipient; returns the response body (success False if none sent)"""
+    from_email = SENDGRID_FROM_EMAIL
+    sent_recipients, errors = _send_email_to_all(recipients, subject, html_content)
+    sent_count = len(sent_recipients)
+
+    if sent_count == len(recipients):
+        return {
+            "success": True,
+            "message": f"Preview sent to {sent_count} recipient(s)",
+            "recipients": recipients,
+            "from": from_email
+        }
+    elif sent_count > 0:
+        return {
+            "success": True,
+            "message": f"Preview sent to {sent_count} of {len(recipients)} recipient(s)",
+            "recipients": sent_recipients,
+            "errors": errors,
+            "from": from_email
+        }
+    else:
+        return {
+            "success": False,
+            "error": "Failed to send to any recipients",
+            "details": errors
+        }
+
+
 @app.route('/api/send-preview', methods=['POST'])
 def send_preview():
-    """Send newsletter preview to team members via SendGrid"""
+    """
+    Send newsletter preview to team members via SendGrid
+
+    Pass "async": true to get a job id back immediately and poll /api/jobs/<job_id>.
+
+    The response includes an "html_etag"; a later export call can send that
+    instead of the HTML. An etag this instance no longer has gets a 409 with
+    error "unknown_html_etag" - retry with the full "html".
+    """
     try:
         data = request.json
         recipients = data.get('recipients', [])
         subject = data.get('subject', 'BriteCo Brief Preview')
-        html_content = data.get('html', '')
+        html_content, html_etag = _resolve_html(data)
 
+        if not html_content and html_etag:
+            return _unknown_etag_response(html_etag)
         if not recipients or not html_content:
             return jsonify({"success": False, "error": "Recipients and HTML content required"}), 400
 
@@ -2855,84 +4071,33 @@ def send_preview():
                 "error": "SendGrid library not installed. Run: pip install sendgrid"
             }), 500
 
-        # Get SendGrid configuration (check both with and without underscore prefix for Secret Manager)
-        sendgrid_api_key = os.environ.get('SENDGRID_API_KEY') or os.environ.get('_SENDGRID_API_KEY')
-        from_email = os.environ.get('SENDGRID_FROM_EMAIL') or os.environ.get('_SENDGRID_FROM_EMAIL') or 'marketing@brite.co'
-        from_name = os.environ.get('SENDGRID_FROM_NAME') or os.environ.get('_SENDGRID_FROM_NAME') or 'BriteCo Brief'
-
-        safe_print(f"[API] SendGrid API key exists: {bool(sendgrid_api_key)}")
+        # SendGrid configuration (read once at startup)
+        safe_print(f"[API] SendGrid API key exists: {bool(SENDGRID_API_KEY)}")
         safe_print(f"[API] Checking SENDGRID_API_KEY: {bool(os.environ.get('SENDGRID_API_KEY'))}, _SENDGRID_API_KEY: {bool(os.environ.get('_SENDGRID_API_KEY'))}")
-        safe_print(f"[API] From email: {from_email}")
+        safe_print(f"[API] From email: {SENDGRID_FROM_EMAIL}")
 
-        if not sendgrid_api_key:
+        if not SENDGRID_API_KEY:
             return jsonify({
                 "success": False,
                 "error": "SendGrid API key not configured. Add SENDGRID_API_KEY environment variable."
             }), 500
 
-        # Initialize SendGrid client
-        sg = sendgrid.SendGridAPIClient(api_key=sendgrid_api_key)
-
-        # Send email to each recipient
-        sent_count = 0
-        errors = []
-
-        for recipient in recipients:
-            try:
-                safe_print(f"[API] Sending to: {recipient}")
-
-                message = Mail(
-                    from_email=(from_email, from_name),
-                    to_emails=recipient,
-                    subject=subject,
-                    html_content=html_content
-                )
-
-                response = sg.send(message)
-
-                safe_print(f"[API] SendGrid response status: {response.status_code}")
-
-                if response.status_code in [200, 201, 202]:
-                    sent_count += 1
-                    safe_print(f"[API] Email sent successfully to: {recipient}")
-                else:
-                    error_msg = f"SendGrid returned status {response.status_code} for {recipient}"
-                    safe_print(f"[API] {error_msg}")
-                    errors.append(error_msg)
-
-            except Exception as email_error:
-                error_msg = f"Failed to send to {recipient}: {str(email_error)}"
-                safe_print(f"[API] {error_msg}")
-                # Log more details for debugging
-                if hasattr(email_error, 'body'):
-                    safe_print(f"[API] Error body: {email_error.body}")
-                errors.append(error_msg)
-
-        if sent_count == len(recipients):
-            return jsonify({
-                "success": True,
-                "message": f"Preview sent to {sent_count} recipient(s)",
-                "recipients": recipients,
-                "from": from_email
-            })
-        elif sent_count > 0:
+        if data.get('async'):
+            job_id = BACKGROUND_JOBS.submit(_send_preview_batch, recipients, subject, html_content)
+            safe_print(f"[API] Preview send job {job_id} queued")
             return jsonify({
                 "success": True,
-                "message": f"Preview sent to {sent_count} of {len(recipients)} recipient(s)",
-                "recipients": recipients[:sent_count],
-                "errors": errors,
-                "from": from_email
-            })
-        else:
-            return jsonify({
-                "success": False,
-                "error": "Failed to send to any recipients",
-                "details": errors
-            }), 500
+                "job_id": job_id,
+                "status_url": f"/api/jobs/{job_id}",
+                "html_etag": html_etag
+            }), 202
+
+        result = _send_preview_batch(recipients, subject, html_content)
+        result["html_etag"] = html_etag
+        return jsonify(result), 200 if result["success"] else 500
 
     except Exception as e:
         safe_print(f"[API] Send preview error: {e}")
-        import traceback
         traceback.print_exc()
         return jsonify({"success": False, "error": str(e)}), 500
 
@@ -3034,41 +4199,12 @@ def export_to_docs():
         # Build document content from newsletter sections
         requests_list = []
 
-        # Helper to convert HTML to plain text
-        def html_to_plain_text(html_content):
-            if not html_content:
-                return ''
-            import re
-            text = str(html_content)
-            # Convert links: <a href="url">text</a> -> text (url)
-            text = re.sub(r'<a[^>]*href=["\']([^"\']*)["\'][^>]*>([^<]*)</a>', r'\2 (\1)', text)
-            # Convert <li> to bullet points
-            text = re.sub(r'<li[^>]*>', '• ', text)
-            text = re.sub(r'</li>', '\n', text)
-            # Convert <p> to paragraphs
-            text = re.sub(r'<p[^>]*>', '', text)
-            text = re.sub(r'</p>', '\n\n', text)
-            # Remove all other HTML tags
-            text = re.sub(r'<[^>]+>', '', text)
-            # Decode HTML entities
-            text = text.replace('&amp;', '&')
-            text = text.replace('&lt;', '<')
-            text = text.replace('&gt;', '>')
-            text = text.replace('&quot;', '"')
-            text = text.replace('&#39;', "'")
-            text = text.replace('&nbsp;', ' ')
-            # Remove ** markdown bold markers
-            text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)
-            # Clean up whitespace
-            text = re.sub(r'\n{3,}', '\n\n', text)
-            return text.strip()
-
         # Helper to add text with formatting
         def add_text(text, bold=False, heading=False, index_offset=[1]):
             if not text:
                 return
             # Convert HTML to plain text
-            text = html_to_plain_text(text)
+            text = html_to_doc_text(text)
             if not text:
                 return
             text = text.strip() + '\n\n'
@@ -3175,53 +4311,30 @@ def export_to_docs():
         email_errors = []
         if send_email and recipients:
             try:
-                # Check both with and without underscore prefix for Secret Manager
-                sendgrid_api_key = os.environ.get('SENDGRID_API_KEY') or os.environ.get('_SENDGRID_API_KEY')
-                from_email = os.environ.get('SENDGRID_FROM_EMAIL') or os.environ.get('_SENDGRID_FROM_EMAIL') or 'marketing@brite.co'
-                from_name = os.environ.get('SENDGRID_FROM_NAME') or os.environ.get('_SENDGRID_FROM_NAME') or 'BriteCo Brief'
-
-                if sendgrid_api_key and SENDGRID_AVAILABLE:
-                    sg = sendgrid.SendGridAPIClient(api_key=sendgrid_api_key)
-
-                    for recipient in recipients:
-                        try:
-                            email_html = f"""
-                            <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
-                                <h2 style="color: #008181;">Agent Newsletter Ready for Review</h2>
-                                <p>Hello,</p>
-                                <p>The <strong>{month} {year}</strong> Agent Newsletter has been exported to Google Docs and is ready for your review.</p>
-                                <p style="margin: 20px 0;">
-                                    <a href="{doc_url}" style="background: #008181; color: white; padding: 12px 24px; text-decoration: none; border-radius: 4px; display: inline-block;">
-                                        Open Google Doc
-                                    </a>
-                                </p>
-                                <p style="color: #666; font-size: 14px;">Or copy this link: {doc_url}</p>
-                                <hr style="border: none; border-top: 1px solid #eee; margin: 20px 0;">
-                                <p style="color: #999; font-size: 12px;">Sent by BriteCo Brief Newsletter Generator</p>
-                            </div>
-                            """
-
-                            message = Mail(
-                                from_email=(from_email, from_name),
-                                to_emails=recipient,
-                                subject=f"Agent Newsletter ({month}, {year}) - Ready for Review",
-                                html_content=email_html
-                            )
-
-                            response = sg.send(message)
-
-                            if response.status_code in [200, 201, 202]:
-                                emails_sent.append(recipient)
-                                safe_print(f"[API] Email sent to {recipient}")
-                            else:
-                                error_msg = f"SendGrid returned status {response.status_code} for {recipient}"
-                                email_errors.append(error_msg)
-                                safe_print(f"[API] {error_msg}")
-
-                        except Exception as email_error:
-                            error_msg = f"Failed to send to {recipient}: {str(email_error)}"
-                            email_errors.append(error_msg)
-                            safe_print(f"[API] {error_msg}")
+                if SENDGRID_API_KEY and SENDGRID_AVAILABLE:
+                    email_html = f"""
+                    <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
+                        <h2 style="color: #008181;">Agent Newsletter Ready for Review</h2>
+                        <p>Hello,</p>
+                        <p>The <strong>{month} {year}</strong> Agent Newsletter has been exported to Google Docs and is ready for your review.</p>
+                        <p style="margin: 20px 0;">
+                            <a href="{doc_url}" style="background: #008181; color: white; padding: 12px 24px; text-decoration: none; border-radius: 4px; display: inline-block;">
+                                Open Google Doc
+                            </a>
+                        </p>
+                        <p style="color: #666; font-size: 14px;">Or copy this link: {doc_url}</p>
+                        <hr style="border: none; border-top: 1px solid #eee; margin: 20px 0;">
+                        <p style="color: #999; font-size: 12px;">Sent by BriteCo Brief Newsletter Generator</p>
+                    </div>
+                    """
+
+                    sent, errors = _send_email_to_all(
+                        recipients,
+                        f"Agent Newsletter ({month}, {year}) - Ready for Review",
+                        email_html
+                    )
+                    emails_sent.extend(sent)
+                    email_errors.extend(errors)
                 else:
                     safe_print("[API] SendGrid not configured (SENDGRID_API_KEY not set)")
                     email_errors.append("SendGrid not configured")
@@ -3240,7 +4353,6 @@ def export_to_docs():
         })
 
     except Exception as e:
-        import traceback
         traceback.print_exc()
         safe_print(f"[API] Export error: {e}")
         return jsonify({"success": False, "error": str(e)}), 500
@@ -3267,10 +4379,9 @@ def send_doc_email():
         if not SENDGRID_AVAILABLE:
             return jsonify({"success": False, "error": "SendGrid not available"}), 500
 
-        # Check both with and without underscore prefix for Secret Manager
-        sendgrid_api_key = os.environ.get('SENDGRID_API_KEY') or os.environ.get('_SENDGRID_API_KEY')
-        from_email = os.environ.get('SENDGRID_FROM_EMAIL') or os.environ.get('_SENDGRID_FROM_EMAIL') or 'marketing@brite.co'
-        from_name = os.environ.get('SENDGRID_FROM_NAME') or os.environ.get('_SENDGRID_FROM_NAME') or 'BriteCo Brief'
+        sendgrid_api_key = SENDGRID_API_KEY
+        from_email = SENDGRID_FROM_EMAIL
+        from_name = SENDGRID_FROM_NAME
 
         # Debug logging
         safe_print(f"[API] SendGrid API key length: {len(sendgrid_api_key) if sendgrid_api_key else 0}")
@@ -3283,45 +4394,27 @@ def send_doc_email():
         if len(sendgrid_api_key) < 20:
             safe_print(f"[API] WARNING: SendGrid API key appears too short ({len(sendgrid_api_key)} chars)")
 
-        sg = sendgrid.SendGridAPIClient(api_key=sendgrid_api_key)
-
-        emails_sent = []
-        email_errors = []
-
-        for recipient in recipients:
-            try:
-                email_html = f"""
-                <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
-                    <h2 style="color: #008181;">Agent Newsletter Ready for Review</h2>
-                    <p>Hello,</p>
-                    <p>The <strong>{month} {year}</strong> Agent Newsletter has been exported to Google Docs and is ready for your review.</p>
-                    <p style="margin: 20px 0;">
-                        <a href="{doc_url}" style="background: #008181; color: white; padding: 12px 24px; text-decoration: none; border-radius: 4px; display: inline-block;">
-                            Open Google Doc
-                        </a>
-                    </p>
-                    <p style="color: #666; font-size: 14px;">Or copy this link: {doc_url}</p>
-                    <hr style="border: none; border-top: 1px solid #eee; margin: 20px 0;">
-                    <p style="color: #999; font-size: 12px;">Sent by BriteCo Brief Newsletter Generator</p>
-                </div>
-                """
-
-                # Use simpler Mail constructor for reliability
-                message = Mail(
-                    from_email=(from_email, from_name),
-                    to_emails=recipient,
-                    subject=f"Agent Newsletter ({month} {year}) - Ready for Review",
-                    html_content=email_html
-                )
-
-                response = sg.send(message)
-                safe_print(f"[API] Email sent to {recipient}, status: {response.status_code}")
-                emails_sent.append(recipient)
-            except Exception as email_error:
-                import traceback
-                safe_print(f"[API] Failed to send to {recipient}: {email_error}")
-                safe_print(f"[API] Email error traceback: {traceback.format_exc()}")
-                email_errors.append(str(email_error))
+        email_html = f"""
+            <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
+                <h2 style="color: #008181;">Agent Newsletter Ready for Review</h2>
+                <p>Hello,</p>
+                <p>The <strong>{month} {year}</strong> Agent Newsletter has been exported to Google Docs and is ready for your review.</p>
+                <p style="margin: 20px 0;">
+                    <a href="{doc_url}" style="background: #008181; color: white; padding: 12px 24px; text-decoration: none; border-radius: 4px; display: inline-block;">
+                        Open Google Doc
+                    </a>
+                </p>
+                <p style="color: #666; font-size: 14px;">Or copy this link: {doc_url}</p>
+                <hr style="border: none; border-top: 1px solid #eee; margin: 20px 0;">
+                <p style="color: #999; font-size: 12px;">Sent by BriteCo Brief Newsletter Generator</p>
+            </div>
+            """
+
+        emails_sent, email_errors = _send_email_to_all(
+            recipients,
+            f"Agent Newsletter ({month} {year}) - Ready for Review",
+            email_html
+        )
 
         if emails_sent:
             return jsonify({
@@ -3336,7 +4429,6 @@ def send_doc_email():
             }), 500
 
     except Exception as e:
-        import traceback
         traceback.print_exc()
         safe_print(f"[API] Send doc email error: {e}")
         return jsonify({"success": False, "error": str(e)}), 500
@@ -3349,12 +4441,20 @@ def send_doc_email():
 @app.route('/api/send-to-ontraport', methods=['POST'])
 @app.route('/api/push-to-ontraport', methods=['POST'])
 def send_to_ontraport():
-    """Send newsletter to Ontraport for distribution"""
+    """
+    Send newsletter to Ontraport for distribution
+
+    Accepts "html", or the "html_etag" from an earlier export response. An
+    etag this instance no longer has gets a 409 with error "unknown_html_etag"
+    - retry with the full "html".
+    """
     try:
         data = request.json
-        html_content = data.get('html', '')
+        html_content, html_etag = _resolve_html(data)
         subject = data.get('subject', 'BriteCo Brief')
 
+        if not html_content and html_etag:
+            return _unknown_etag_response(html_etag)
         if not html_content:
             return jsonify({"success": False, "error": "HTML content required"}), 400
 
@@ -3384,7 +4484,8 @@ def send_to_ontraport():
                 "message_id": result.get('message_id'),
                 "campaign_id": result.get('campaign_id'),
                 "preview_url": result.get('preview_url'),
-                "status": result.get('status', 'draft')
+                "status": result.get('status', 'draft'),
+                "html_etag": html_etag
             })
         else:
             return jsonify({
@@ -3436,7 +4537,8 @@ def upload_images_to_gcs():
                 filename = f"newsletters/{year}/{month.lower()}/{timestamp}-{safe_section}.{img_format}"
 
                 blob = bucket.blob(filename)
-                blob.upload_from_string(image_bytes, content_type=f'image/{img_format}')
+                content_type = 'image/jpeg' if img_format == 'jpg' else f'image/{img_format}'
+                blob.upload_from_string(image_bytes, content_type=content_type)
                 blob.make_public()
                 uploaded_urls[section] = blob.public_url
                 safe_print(f"[GCS] Uploaded {section} -> {blob.public_url}")
@@ -3449,7 +4551,6 @@ def upload_images_to_gcs():
 
     except Exception as e:
         safe_print(f"[GCS UPLOAD] Error: {str(e)}")
-        import traceback
         traceback.print_exc()
         return jsonify({'success': False, 'error': str(e)}), 500
 
@@ -3487,7 +4588,7 @@ def save_draft():
 
         bucket = gcs_client.bucket(GCS_BUCKET_NAME)
         blob = bucket.blob(blob_name)
-        blob.upload_from_string(json.dumps(draft), content_type='application/json')
+        blob.upload_from_string(orjson.dumps(draft), content_type='application/json')
         return jsonify({'success': True, 'file': blob_name})
 
     except Exception as e:
@@ -3506,7 +4607,7 @@ def list_drafts():
         drafts = []
         for blob in blobs:
             if blob.name.endswith('.json'):
-                data = json.loads(blob.download_as_text())
+                data = orjson.loads(blob.download_as_bytes())
                 drafts.append({
                     'filename': blob.name,
                     'month': data.get('month'),
@@ -3535,7 +4636,7 @@ def load_draft():
         blob = bucket.blob(filename)
         if not blob.exists():
             return jsonify({'success': False, 'error': 'Draft not found'}), 404
-        data = json.loads(blob.download_as_text())
+        data = orjson.loads(blob.download_as_bytes())
         return jsonify({'success': True, 'draft': data})
     except Exception as e:
         safe_print(f"[DRAFT LOAD ERROR] {str(e)}")
@@ -3576,7 +4677,7 @@ def list_published():
         newsletters = []
         for blob in blobs:
             if blob.name.endswith('.json'):
-                data = json.loads(blob.download_as_text())
+                data = orjson.loads(blob.download_as_bytes())
                 gc = data.get('generatedContent', {})
                 newsletters.append({
                     'filename': blob.name,
@@ -3610,7 +4711,7 @@ def load_published():
         blob = bucket.blob(filename)
         if not blob.exists():
             return jsonify({'success': False, 'error': 'Not found'}), 404
-        data = json.loads(blob.download_as_text())
+        data = orjson.loads(blob.download_as_bytes())
         return jsonify({'success': True, 'draft': data})
     except Exception as e:
         safe_print(f"[PUBLISHED LOAD ERROR] {str(e)}")
@@ -3651,7 +4752,7 @@ def get_saved_articles():
         bucket = gcs_client.bucket(GCS_BUCKET_NAME)
         blob = bucket.blob(SAVED_ARTICLES_BLOB)
         if blob.exists():
-            data = json.loads(blob.download_as_text())
+            data = orjson.loads(blob.download_as_bytes())
             # Handle both old format (list) and new format ({articles: []})
             if isinstance(data, list):
                 return jsonify({'success': True, 'articles': data})
@@ -3677,7 +4778,7 @@ def add_saved_article():
 
         articles = []
         if blob.exists():
-            data = json.loads(blob.download_as_text())
+            data = orjson.loads(blob.download_as_bytes())
             if isinstance(data, list):
                 articles = data
             else:
@@ -3691,7 +4792,7 @@ def add_saved_article():
         article['dateSaved'] = datetime.now(CHICAGO_TZ).isoformat()
         articles.insert(0, article)
 
-        blob.upload_from_string(json.dumps({'articles': articles}), content_type='application/json')
+        blob.upload_from_string(orjson.dumps({'articles': articles}), content_type='application/json')
         return jsonify({'success': True, 'articles': articles})
 
     except Exception as e:
@@ -3714,14 +4815,14 @@ def delete_saved_article():
 
         articles = []
         if blob.exists():
-            data = json.loads(blob.download_as_text())
+            data = orjson.loads(blob.download_as_bytes())
             if isinstance(data, list):
                 articles = data
             else:
                 articles = data.get('articles', [])
 
         articles = [a for a in articles if a.get('url') != url]
-        blob.upload_from_string(json.dumps({'articles': articles}), content_type='application/json')
+        blob.upload_from_string(orjson.dumps({'articles': articles}), content_type='application/json')
         return jsonify({'success': True, 'articles': articles})
 
     except Exception as e:
@@ -3767,7 +4868,7 @@ def track_selection():
         if blob.exists():
             existing = blob.download_as_text()
 
-        new_content = existing + json.dumps(selection) + '\n'
+        new_content = existing + orjson.dumps(selection).decode('utf-8') + '\n'
         blob.upload_from_string(new_content, content_type='application/jsonl')
 
         return jsonify({'success': True})
@@ -3784,4 +4885,7 @@ if __name__ == '__main__':
     port = int(os.environ.get('PORT', 8080))
     print(f"\n=== BriteCo Brief API Server ===")
     print(f"Starting on port {port}")
-    app.run(host='0.0.0.0', port=port, debug=True)
+    # Local development only - deployments run under gunicorn (see Procfile).
+    # The reloader/debugger stay off unless FLASK_DEBUG is set.
+    debug = os.environ.get('FLASK_DEBUG', '').lower() in ('1', 'true')
+    app.run(host='0.0.0.0', port=port, debug=debug, threaded=True)
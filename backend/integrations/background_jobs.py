@@ -0,0 +1,63 @@
+"""
+In-process background jobs for slow endpoints
+
+Long-running work (image generation, etc.) is submitted to a dedicated thread
+pool and the route returns a job id immediately; the frontend then polls for
+the result. Jobs live in this process's memory, so a poll has to reach the
+same worker that accepted the job.
+"""
+
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+
+class JobRegistry:
+    """Tracks futures by job id and forgets finished jobs after a TTL"""
+
+    def __init__(self, max_workers: int = 8, ttl: float = 900):
+        # Separate from the app's IO pool so a job can fan out on that pool
+        # without ever waiting on itself
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='job')
+        self.ttl = ttl
+        self._jobs = {}  # job_id -> (submitted_at, future)
+        self._lock = threading.Lock()
+
+    def submit(self, fn: Callable[..., Any], *args, **kwargs) -> str:
+        """Run fn in the background and return its job id"""
+        job_id = uuid.uuid4().hex
+        future = self.executor.submit(fn, *args, **kwargs)
+        with self._lock:
+            self._purge_expired()
+            self._jobs[job_id] = (time.monotonic(), future)
+        return job_id
+
+    def status(self, job_id: str) -> Optional[dict]:
+        """
+        Return {'done': False} while running, then {'done': True, 'result': ...}
+        or {'done': True, 'error': ...}. None if the job id is unknown.
+        """
+        with self._lock:
+            entry = self._jobs.get(job_id)
+        if entry is None:
+            return None
+
+        future = entry[1]
+        if not future.done():
+            return {'done': False}
+
+        error = future.exception()
+        if error is not None:
+            return {'done': True, 'error': str(error)}
+        return {'done': True, 'result': future.result()}
+
+    def _purge_expired(self) -> None:
+        now = time.monotonic()
+        expired = [
+            job_id for job_id, (submitted_at, future) in self._jobs.items()
+            if future.done() and now - submitted_at > self.ttl
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
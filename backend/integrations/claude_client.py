@@ -5,7 +5,12 @@ For content generation using Claude models
 
 import os
 import time
-from anthropic import Anthropic
+import traceback
+import orjson
+from anthropic import Anthropic, DefaultHttpxClient
+
+from .http_pool import HTTPX_HTTP2, HTTPX_LIMITS
+from .response_cache import ResponseCache, make_cache_key
 
 
 class ClaudeClient:
@@ -17,16 +22,31 @@ class ClaudeClient:
         if not self.api_key:
             raise ValueError("ANTHROPIC_API_KEY not found in environment")
 
-        self.client = Anthropic(api_key=self.api_key)
+        self.client = Anthropic(
+            api_key=self.api_key,
+            http_client=DefaultHttpxClient(limits=HTTPX_LIMITS, http2=HTTPX_HTTP2)
+        )
         self.default_model = "claude-opus-4-5-20251101"  # Claude Opus 4.5 (frontier model for writing)
 
+        # Exact-match cache so regenerating an unchanged section skips the API call
+        self.cache = ResponseCache(
+            maxsize=int(os.getenv('LLM_CACHE_SIZE', 512)),
+            ttl=float(os.getenv('LLM_CACHE_TTL', 3600))
+        )
+        # Optional semantic tier (a SemanticCache); off unless the app attaches one
+        self.semantic_cache = None
+        # Optional client-side throttle (a TokenBucket), also attached by the app
+        self.rate_limiter = None
+
     def generate_content(
         self,
         prompt: str,
         system_prompt: str = None,
         temperature: float = 0.7,
         max_tokens: int = 2000,
-        model: str = None
+        model: str = None,
+        use_cache: bool = True,
+        cache_system_prompt: bool = False
     ) -> dict:
         """
         Generate content using Claude
@@ -37,23 +57,50 @@ class ClaudeClient:
             temperature: Creativity (0-1)
             max_tokens: Max response length
             model: Model to use (defaults to claude-3-5-sonnet)
+            use_cache: Return a cached response for an identical request if available
+            cache_system_prompt: Mark the system prompt for Anthropic prompt caching;
+                only worth it for a long prompt reused verbatim across calls
 
         Returns:
-            dict with content, model, tokens, cost_estimate, latency_ms
+            dict with content, model, tokens, cost_estimate, latency_ms, stop_reason
+            (plus cached=True when served from cache)
         """
         start_time = time.time()
 
         model_name = model or self.default_model
 
+        cache_key = None
+        embedding = None
+        if use_cache:
+            cache_key = make_cache_key(model_name, system_prompt, prompt, temperature, max_tokens)
+            cached = self.cache.get(cache_key)
+            if cached is None and self.semantic_cache is not None:
+                # Only the prompt is embedded, so every other request parameter
+                # has to match exactly for a near-duplicate to count
+                semantic_namespace = make_cache_key(model_name, system_prompt, temperature, max_tokens)
+                embedding = self.semantic_cache.embed(prompt)
+                cached = self.semantic_cache.get(embedding, namespace=semantic_namespace)
+            if cached is not None:
+                cached['cached'] = True
+                cached['latency_ms'] = int((time.time() - start_time) * 1000)
+                return cached
+
         # Build messages
         messages = [{"role": "user", "content": prompt}]
 
+        system = system_prompt if system_prompt else ""
+        if system_prompt and cache_system_prompt:
+            system = [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(self._estimate_tokens(prompt, system_prompt, max_tokens))
+
         # Call Claude API
         response = self.client.messages.create(
             model=model_name,
             max_tokens=max_tokens,
             temperature=temperature,
-            system=system_prompt if system_prompt else "",
+            system=system,
             messages=messages
         )
 
@@ -66,23 +113,139 @@ class ClaudeClient:
         # Calculate tokens
         input_tokens = response.usage.input_tokens
         output_tokens = response.usage.output_tokens
-        total_tokens = input_tokens + output_tokens
+        # Prompt-cache usage is reported separately from input_tokens
+        cache_read_tokens = getattr(response.usage, 'cache_read_input_tokens', None) or 0
+        cache_write_tokens = getattr(response.usage, 'cache_creation_input_tokens', None) or 0
+        total_tokens = input_tokens + cache_read_tokens + cache_write_tokens + output_tokens
 
         # Estimate cost
-        cost_estimate = self._estimate_cost(model_name, input_tokens, output_tokens)
+        cost_estimate = self._estimate_cost(
+            model_name, input_tokens, output_tokens, cache_read_tokens, cache_write_tokens
+        )
 
-        return {
+        result = {
             "content": content,
             "model": model_name,
             "tokens": total_tokens,
             "input_tokens": input_tokens,
             "output_tokens": output_tokens,
+            "cache_read_input_tokens": cache_read_tokens,
+            "cache_creation_input_tokens": cache_write_tokens,
             "cost_estimate": f"${cost_estimate:.4f}",
-            "latency_ms": latency_ms
+            "latency_ms": latency_ms,
+            "stop_reason": response.stop_reason
         }
 
-    def _estimate_cost(self, model: str, input_tokens: int, output_tokens: int) -> float:
-        """Estimate cost based on model pricing"""
+        # A reply cut off at max_tokens isn't worth serving again
+        if cache_key and response.stop_reason != "max_tokens":
+            self.cache.set(cache_key, result)
+            if self.semantic_cache is not None:
+                self.semantic_cache.set(embedding, result, namespace=semantic_namespace)
+
+        return result
+
+    def stream_content(
+        self,
+        prompt: str,
+        system_prompt: str = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        model: str = None
+    ):
+        """
+        Stream a Claude response, yielding text chunks as they arrive
+
+        Same arguments as generate_content, minus caching: a streamed response
+        is never served from or written to the response cache.
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(self._estimate_tokens(prompt, system_prompt, max_tokens))
+
+        with self.client.messages.stream(
+            model=model or self.default_model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            system=system_prompt if system_prompt else "",
+            messages=[{"role": "user", "content": prompt}]
+        ) as stream:
+            for text in stream.text_stream:
+                yield text
+
+    def submit_batch(
+        self,
+        prompts: dict,
+        system_prompt: str = None,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        model: str = None,
+        cache_system_prompt: bool = False
+    ) -> str:
+        """
+        Queue many prompts on the Message Batches API (half the per-token
+        price, but results can take minutes to hours) and return the batch id;
+        collect the output later with batch_results
+
+        Args:
+            prompts: custom_id -> user prompt (ids must match [a-zA-Z0-9_-]{1,64})
+            (other arguments as in generate_content, applied to every prompt)
+        """
+        system = system_prompt if system_prompt else ""
+        if system_prompt and cache_system_prompt:
+            system = [{"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}]
+
+        batch = self.client.messages.batches.create(requests=[
+            {
+                "custom_id": custom_id,
+                "params": {
+                    "model": model or self.default_model,
+                    "max_tokens": max_tokens,
+                    "temperature": temperature,
+                    "system": system,
+                    "messages": [{"role": "user", "content": prompt}]
+                }
+            }
+            for custom_id, prompt in prompts.items()
+        ])
+        return batch.id
+
+    def batch_results(self, batch_id: str):
+        """
+        Check a batch from submit_batch without waiting on it
+
+        Returns None while the batch is still processing, then a dict of
+        custom_id -> response text (None for a request that errored, expired
+        or was canceled). Anthropic keeps the results for 29 days, so this
+        works from any instance, not only the one that submitted the batch.
+        """
+        batch = self.client.messages.batches.retrieve(batch_id)
+        if batch.processing_status != "ended":
+            return None
+
+        results = {}
+        for entry in self.client.messages.batches.results(batch_id):
+            succeeded = entry.result.type == "succeeded"
+            results[entry.custom_id] = entry.result.message.content[0].text if succeeded else None
+        return results
+
+    @staticmethod
+    def _estimate_tokens(prompt: str, system_prompt: str, max_tokens: int) -> int:
+        """Rough upper bound on a call's token usage (~4 characters per input token)"""
+        return (len(prompt) + len(system_prompt or "")) // 4 + max_tokens
+
+    def _estimate_cost(
+        self,
+        model: str,
+        input_tokens: int,
+        output_tokens: int,
+        cache_read_tokens: int = 0,
+        cache_write_tokens: int = 0
+    ) -> float:
+        """
+        Estimate cost based on model pricing. Prompt-cache reads bill at 10% of
+        the input rate and cache writes at 125%.
+        """
+        # Express cached tokens as their equivalent in regular input tokens
+        input_tokens = input_tokens + cache_read_tokens * 0.1 + cache_write_tokens * 1.25
 
         # Claude 3.5 Sonnet pricing (as of 2025)
         if "sonnet" in model.lower():
@@ -172,8 +335,7 @@ Return as JSON array with this structure:
                         elif "```" in content:
                             content = content.split("```")[1].split("```")[0].strip()
 
-                        import json
-                        parsed = json.loads(content)
+                        parsed = orjson.loads(content)
                         if isinstance(parsed, list):
                             return parsed[:max_results]
                     except:
@@ -183,7 +345,6 @@ Return as JSON array with this structure:
 
         except Exception as e:
             print(f"Claude web search error: {e}")
-            import traceback
             traceback.print_exc()
             return []
 
@@ -201,3 +362,15 @@ Return as JSON array with this structure:
         """Search for seasonal wedding trends"""
         query = f"wedding trends {season} 2025 2026 venue decor planning {month}"
         return self.search_web(query, max_results=5)
+
+
+# Singleton instance
+_claude_client = None
+
+
+def get_claude_client() -> ClaudeClient:
+    """Get or create Claude client singleton"""
+    global _claude_client
+    if _claude_client is None:
+        _claude_client = ClaudeClient()
+    return _claude_client
@@ -4,11 +4,17 @@ Using the official google-genai Python SDK
 """
 
 import os
+import threading
 import time
-import base64
+import traceback
+import orjson
+from io import BytesIO
 from typing import Dict, Optional
-from google import genai
-from google.genai import types
+
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
 
 
 class GeminiClient:
@@ -21,6 +27,10 @@ class GeminiClient:
         self.default_model = os.getenv("DEFAULT_IMAGE_MODEL", "gemini-2.5-flash-image")
 
         if self.api_key:
+            # The SDK is slow to import and only the image routes need it,
+            # so it loads with the first client rather than with the app
+            from google import genai
+
             # Initialize the client with API key
             self.client = genai.Client(api_key=self.api_key)
             print("[OK] Gemini initialized")
@@ -53,6 +63,7 @@ class GeminiClient:
         Returns:
             {
                 "image_data": "base64_encoded_image",
+                "image_bytes": b"raw PNG bytes",
                 "prompt": "original prompt",
                 "model": "model-used",
                 "cost_estimate": "$0.039",
@@ -98,6 +109,7 @@ class GeminiClient:
 
             # Extract image data from response parts using part.as_image()
             image_data = None
+            image_bytes = None
 
             for i, part in enumerate(parts):
                 print(f"[NANO BANANA DEBUG] Part {i}: has inline_data = {hasattr(part, 'inline_data')}, has text = {hasattr(part, 'text')}")
@@ -115,11 +127,10 @@ class GeminiClient:
                             print(f"[NANO BANANA DEBUG] Got PIL Image from _pil_image: {type(pil_image)}, size: {pil_image.size}")
 
                             # Convert PIL Image to base64
-                            from io import BytesIO
                             buffer = BytesIO()
                             pil_image.save(buffer, format='PNG')
                             image_bytes = buffer.getvalue()
-                            image_data = base64.b64encode(image_bytes).decode('utf-8')
+                            image_data = base64.b64encode(image_bytes).decode('ascii')
 
                             print(f"[NANO BANANA DEBUG] Image converted successfully, base64 size: {len(image_data)} bytes")
                             break
@@ -128,7 +139,6 @@ class GeminiClient:
                             print(f"[NANO BANANA ERROR] Available attributes: {[a for a in dir(image_obj) if not a.startswith('__')]}")
                     except Exception as img_error:
                         print(f"[NANO BANANA ERROR] Failed to convert image: {img_error}")
-                        import traceback
                         traceback.print_exc()
 
             if not image_data:
@@ -145,6 +155,7 @@ class GeminiClient:
 
             return {
                 "image_data": image_data,  # Base64 encoded PNG
+                "image_bytes": image_bytes,  # Same PNG, raw - lets callers skip a base64 decode
                 "prompt": prompt,
                 "model": model_name,
                 "cost_estimate": f"${cost_estimate:.2f}",
@@ -154,7 +165,6 @@ class GeminiClient:
         except Exception as e:
             print(f"[NANO BANANA ERROR] Image generation failed: {str(e)}")
             print(f"[NANO BANANA ERROR] Model: {model_name}, Prompt: {prompt[:100]}...")
-            import traceback
             traceback.print_exc()
             raise
 
@@ -169,6 +179,8 @@ class GeminiClient:
         Returns:
             List of search results with title, description, url
         """
+        from google.genai import types
+
         try:
             # Use Gemini 2.0 Flash with Google Search grounding
             response = self.client.models.generate_content(
@@ -207,8 +219,7 @@ Return ONLY the JSON array."""],
                     content = content.split("```")[1].split("```")[0].strip()
 
                 try:
-                    import json
-                    results = json.loads(content)
+                    results = orjson.loads(content)
                     if isinstance(results, list):
                         return results[:max_results]
                 except:
@@ -218,7 +229,6 @@ Return ONLY the JSON array."""],
 
         except Exception as e:
             print(f"Gemini web search error: {e}")
-            import traceback
             traceback.print_exc()
             return []
 
@@ -280,11 +290,14 @@ Return ONLY the JSON array."""],
 
 # Singleton instance
 _gemini_client = None
+_gemini_client_lock = threading.Lock()
 
 
 def get_gemini_client() -> GeminiClient:
-    """Get or create Gemini client singleton"""
+    """Get or create Gemini client singleton (first built on demand from a request thread)"""
     global _gemini_client
     if _gemini_client is None:
-        _gemini_client = GeminiClient()
+        with _gemini_client_lock:
+            if _gemini_client is None:
+                _gemini_client = GeminiClient()
     return _gemini_client
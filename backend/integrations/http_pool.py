@@ -0,0 +1,48 @@
+"""
+Shared HTTP connection pooling for the integration clients
+
+Each client keeps one long-lived session (requests for the plain HTTP
+integrations, httpx for the LLM SDKs) so repeat calls to the same API reuse
+warm TCP/TLS connections instead of handshaking on every request.
+"""
+
+import atexit
+import os
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+# Each LLM SDK client talks to a single API host, so over HTTP/2 its concurrent
+# calls (the IO_POOL fan-out) share one connection instead of opening one each.
+# httpx needs the optional h2 package for it; without it, stay on HTTP/1.1.
+try:
+    import h2  # noqa: F401
+    HTTPX_HTTP2 = True
+except ImportError:
+    HTTPX_HTTP2 = False
+
+# Sized to cover the app's IO_POOL fan-out plus concurrent requests
+POOL_SIZE = int(os.getenv('HTTP_POOL_SIZE', 50))
+
+# Keep-alive limits for the LLM SDKs' httpx clients. httpx's defaults keep
+# only 20 idle connections for 5s, so sockets went cold between pipeline steps.
+HTTPX_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=POOL_SIZE,
+    keepalive_expiry=float(os.getenv('HTTP_KEEPALIVE_EXPIRY', 30))
+)
+
+
+def build_requests_session(pool_size: int = POOL_SIZE, max_retries=0) -> requests.Session:
+    """
+    Create a requests.Session with a keep-alive pool, closed at interpreter exit
+
+    max_retries is passed to the HTTPAdapter (an int or a urllib3 Retry).
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=max_retries)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    atexit.register(session.close)
+    return session
@@ -0,0 +1,56 @@
+"""
+Helpers for parsing JSON out of LLM responses
+"""
+
+from typing import Iterable, Iterator
+
+import orjson
+
+
+def strip_code_fence(text: str) -> str:
+    """Trim whitespace and remove a surrounding markdown code fence (```json ... ```) if present"""
+    text = text.strip()
+    # Plain prefix/suffix checks - no regex engine on every model response.
+    # Only text exposed by removing a fence needs re-trimming.
+    if text.startswith("```"):
+        newline = text.find("\n")
+        text = text[newline + 1:] if newline >= 0 else text[3:]
+        if text.endswith("```"):
+            text = text[:-3]
+        return text.strip()
+    return text
+
+
+def iter_json_objects(chunks: Iterable[str], level: int = 0) -> Iterator[dict]:
+    """
+    Yield each object nested `level` objects deep in a streamed JSON document
+    as soon as its closing brace arrives: level 0 for the objects of a bare
+    array, 1 for those in e.g. {"items": [...]}. Braces inside strings are
+    ignored, and text outside the objects (code fence, "[", commas) is skipped.
+
+    Raises orjson.JSONDecodeError if a completed object doesn't parse.
+    """
+    depth = 0
+    in_string = escaped = False
+    current = []
+    for chunk in chunks:
+        for ch in chunk:
+            if depth > level:
+                current.append(ch)
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif ch == '\\':
+                    escaped = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                in_string = depth > 0
+            elif ch == '{':
+                if depth == level:
+                    current = ['{']
+                depth += 1
+            elif ch == '}' and depth:
+                depth -= 1
+                if depth == level:
+                    yield orjson.loads(''.join(current))
@@ -5,8 +5,15 @@ Ontraport API integration for CRM and email campaign management
 import os
 import requests
 import time
+import traceback
 from typing import Dict, List, Optional
-import base64
+
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
+
+from .http_pool import build_requests_session
 
 
 class OntraportClient:
@@ -21,6 +28,9 @@ class OntraportClient:
         if not self.app_id or not self.api_key:
             raise ValueError("Ontraport credentials not configured")
 
+        # Keep-alive session shared by every API call from this client
+        self.session = build_requests_session()
+
         # Headers for JSON requests (used for some endpoints)
         self.headers_json = {
             "Api-Appid": self.app_id,
@@ -52,7 +62,7 @@ class OntraportClient:
         start_time = time.time()
 
         if use_form_encoding:
-            response = requests.request(
+            response = self.session.request(
                 method=method,
                 url=url,
                 headers=self.headers_form,
@@ -60,7 +70,7 @@ class OntraportClient:
                 timeout=30
             )
         else:
-            response = requests.request(
+            response = self.session.request(
                 method=method,
                 url=url,
                 headers=self.headers_json,
@@ -255,7 +265,6 @@ class OntraportClient:
         except Exception as e:
             error_msg = str(e)
             print(f"[Ontraport] Error creating newsletter: {error_msg}")
-            import traceback
             traceback.print_exc()
             return {
                 "success": False,
@@ -4,9 +4,21 @@ OpenAI API integration for content generation
 
 import os
 import time
+import traceback
+import re
+from datetime import datetime
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
 from typing import Dict, List, Optional
-from openai import OpenAI
+from openai import OpenAI, DefaultHttpxClient
 import json
+import orjson
+
+from .http_pool import HTTPX_HTTP2, HTTPX_LIMITS
+from .json_utils import strip_code_fence
+from .response_cache import ResponseCache, make_cache_key
+
+# Input is cut to this many characters before embedding
+EMBED_MAX_CHARS = 8000
 
 
 class OpenAIClient:
@@ -14,9 +26,18 @@ class OpenAIClient:
 
     def __init__(self, api_key: Optional[str] = None):
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
-        self.client = OpenAI(api_key=self.api_key) if self.api_key else None
+        self.client = OpenAI(
+            api_key=self.api_key,
+            http_client=DefaultHttpxClient(limits=HTTPX_LIMITS, http2=HTTPX_HTTP2)
+        ) if self.api_key else None
         self.default_model = os.getenv("DEFAULT_CONTENT_MODEL", "gpt-4o")
 
+        # Web searches recur across editors and reopened panels; reuse recent results
+        self.search_cache = ResponseCache(
+            maxsize=int(os.getenv('SEARCH_CACHE_SIZE', 128)),
+            ttl=float(os.getenv('SEARCH_CACHE_TTL', 1800))
+        )
+
     def generate_content(
         self,
         prompt: str,
@@ -25,6 +46,7 @@ class OpenAIClient:
         temperature: float = 0.7,
         max_tokens: int = 2000,
         tools: Optional[List] = None,
+        response_format: Optional[Dict] = None,
     ) -> Dict:
         """
         Generate content using OpenAI
@@ -36,6 +58,7 @@ class OpenAIClient:
             temperature: Creativity (0-2)
             max_tokens: Maximum response length
             tools: Optional function calling tools
+            response_format: Optional response_format (e.g. a strict json_schema)
 
         Returns:
             {
@@ -73,6 +96,9 @@ class OpenAIClient:
         if tools:
             kwargs["tools"] = tools
 
+        if response_format:
+            kwargs["response_format"] = response_format
+
         response = self.client.chat.completions.create(**kwargs)
 
         latency_ms = int((time.time() - start_time) * 1000)
@@ -92,6 +118,14 @@ class OpenAIClient:
             "raw_response": response,  # Include full response for tool calls
         }
 
+    def embed(self, text: str, model: str = "text-embedding-3-small") -> List[float]:
+        """Return the embedding vector for text (used by the semantic response cache)"""
+        if not self.client:
+            raise ValueError("OpenAI API key not configured")
+
+        response = self.client.embeddings.create(model=model, input=text[:EMBED_MAX_CHARS])
+        return response.data[0].embedding
+
     def generate_newsletter_section(
         self,
         section_type: str,
@@ -167,6 +201,22 @@ Generate the complete section following the structure guidelines."""
         return self.search_web_responses_api(query, max_results, exclude_urls)
 
     def search_web_responses_api(self, query: str, max_results: int = 15, exclude_urls: list = None) -> list:
+        """
+        Search web using OpenAI Responses API with web_search tool, served from
+        search_cache when the same query, limit and exclusions ran recently.
+        """
+        cache_key = make_cache_key(query, max_results, sorted(set(exclude_urls or [])))
+        cached = self.search_cache.get(cache_key)
+        if cached is not None:
+            print(f"[OpenAI Responses API] Cache hit: {query[:100]}...")
+            return cached
+
+        results = self._search_web_uncached(query, max_results, exclude_urls)
+        if results:
+            self.search_cache.set(cache_key, results)
+        return results
+
+    def _search_web_uncached(self, query: str, max_results: int = 15, exclude_urls: list = None) -> list:
         """
         Search web using OpenAI Responses API with web_search tool
 
@@ -265,14 +315,10 @@ No extra keys. No commentary outside JSON."""
                 return []
 
             # Parse JSON, handling markdown fences if present
-            import re
-            text = output_text.strip()
-            if text.startswith("```"):
-                text = re.sub(r"^```[a-zA-Z]*\n", "", text)
-                text = re.sub(r"\n```$", "", text).strip()
+            text = strip_code_fence(output_text)
 
             try:
-                data = json.loads(text)
+                data = orjson.loads(text)
             except json.JSONDecodeError as e:
                 print(f"[OpenAI Responses API ERROR] JSON parsing failed: {e}")
                 print(f"[OpenAI Responses API ERROR] Text preview: {text[:200]}...")
@@ -298,8 +344,6 @@ No extra keys. No commentary outside JSON."""
             # Skip debug printing of titles/URLs to avoid Unicode errors
 
             # Clean and deduplicate results
-            from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
-            import re
 
             # Fuzzy title matching helpers
             STOPWORDS = {
@@ -439,7 +483,6 @@ No extra keys. No commentary outside JSON."""
 
         except Exception as e:
             print(f"[OpenAI Responses API] EXCEPTION: {e}")
-            import traceback
             traceback.print_exc()
             return []
 
@@ -448,7 +491,6 @@ No extra keys. No commentary outside JSON."""
         if not date_str:
             return ""
         try:
-            from datetime import datetime
             pub_date = datetime.strptime(date_str, "%Y-%m-%d")
             now = datetime.now()
             delta = now - pub_date
@@ -7,9 +7,17 @@ Excellent for finding recent news with proper source attribution.
 
 import os
 import json
+import re
+import traceback
 import requests
+import orjson
 from typing import List, Dict
 from datetime import datetime
+from urllib.parse import urlparse
+
+from .http_pool import build_requests_session
+from .json_utils import strip_code_fence
+from .response_cache import ResponseCache, make_cache_key
 
 
 class PerplexityClient:
@@ -19,6 +27,13 @@ class PerplexityClient:
         """Initialize Perplexity client"""
         self.api_key = api_key or os.getenv('PERPLEXITY_API_KEY')
         self.base_url = "https://api.perplexity.ai"
+        self.session = build_requests_session()
+
+        # Repeat searches (dashboard refreshes, re-running a card) reuse recent results
+        self.cache = ResponseCache(
+            maxsize=int(os.getenv('SEARCH_CACHE_SIZE', 128)),
+            ttl=float(os.getenv('SEARCH_CACHE_TTL', 1800))
+        )
 
         if self.api_key:
             print("[OK] Perplexity initialized")
@@ -52,6 +67,12 @@ class PerplexityClient:
             print("[Perplexity] API key not configured")
             return []
 
+        cache_key = make_cache_key(query, time_window, geography, max_results)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            print(f"[Perplexity] Cache hit: {query[:100]}...")
+            return cached
+
         try:
             # Build the search prompt
             time_context = {
@@ -112,7 +133,7 @@ Important:
 
             print(f"[Perplexity] Searching: {query[:100]}...")
 
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/chat/completions",
                 headers=headers,
                 json=payload,
@@ -154,6 +175,8 @@ Important:
                 r['category'] = 'research'
 
             print(f"[Perplexity] Found {len(results)} results")
+            if results:
+                self.cache.set(cache_key, results)
             return results
 
         except requests.exceptions.Timeout:
@@ -164,13 +187,11 @@ Important:
             return []
         except Exception as e:
             print(f"[Perplexity] Error: {e}")
-            import traceback
             traceback.print_exc()
             return []
 
     def _parse_with_citations(self, content: str, citations: list, max_results: int) -> List[Dict]:
         """Parse results using Perplexity's citations array with better title extraction"""
-        import re
 
         results = []
 
@@ -237,7 +258,6 @@ Important:
         # If it's too long, try to extract the key phrase
         if len(first) > 80:
             # Look for key patterns that make good titles
-            import re
 
             # Pattern: "X is/are Y" - extract the core claim
             match = re.search(r'^([^,]{20,70})', first)
@@ -284,14 +304,10 @@ Important:
 
     def _parse_results(self, content: str, max_results: int) -> List[Dict]:
         """Parse JSON results from Perplexity response (legacy approach)"""
-        import re
 
         # Try to extract JSON from the response
         # Handle markdown code blocks
-        text = content.strip()
-        if text.startswith("```"):
-            text = re.sub(r"^```[a-zA-Z]*\n", "", text)
-            text = re.sub(r"\n```$", "", text).strip()
+        text = strip_code_fence(content)
 
         # Try to find JSON object in text
         json_match = re.search(r'\{[\s\S]*"results"[\s\S]*\}', text)
@@ -299,7 +315,7 @@ Important:
             text = json_match.group(0)
 
         try:
-            data = json.loads(text)
+            data = orjson.loads(text)
             results = data.get('results', [])
 
             # Normalize and validate results
@@ -339,7 +355,6 @@ Important:
 
     def _parse_plain_text(self, content: str, max_results: int) -> List[Dict]:
         """Fallback: extract URLs and context from plain text response"""
-        import re
 
         results = []
         # Find URLs in the text
@@ -365,7 +380,6 @@ Important:
     def _extract_domain(self, url: str) -> str:
         """Extract domain name from URL"""
         try:
-            from urllib.parse import urlparse
             parsed = urlparse(url)
             domain = parsed.netloc
             # Remove www. prefix
@@ -407,3 +421,15 @@ Include:
 {"Geographic focus: " + geography if geography else "Consider US market primarily."}
 """
         return self.search(query, time_window, geography, max_results=8)
+
+
+# Singleton instance
+_perplexity_client = None
+
+
+def get_perplexity_client() -> PerplexityClient:
+    """Get or create Perplexity client singleton"""
+    global _perplexity_client
+    if _perplexity_client is None:
+        _perplexity_client = PerplexityClient()
+    return _perplexity_client
@@ -0,0 +1,57 @@
+"""
+Client-side rate limiting for LLM API calls
+
+A token bucket per limit (requests and tokens per minute) keeps bursts from
+the UI under the provider's quota, so calls wait briefly here instead of
+drawing 429s and the SDK's exponential backoff.
+"""
+
+import threading
+import time
+
+
+class RateLimitExceeded(Exception):
+    """The wait for capacity would exceed the caller's limit; retry after retry_after seconds"""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"Rate limit reached, retry in {retry_after:.0f}s")
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """Thread-safe requests-per-minute + tokens-per-minute limiter"""
+
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float, max_wait: float = 10):
+        self.capacity = (float(requests_per_minute), float(tokens_per_minute))
+        self.max_wait = max_wait
+        self._available = list(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int) -> None:
+        """
+        Reserve one request and `tokens` tokens, sleeping until they are available.
+
+        Raises RateLimitExceeded instead of sleeping longer than max_wait.
+        """
+        # A single call larger than the whole bucket only has to wait for a full one
+        wanted = (1.0, min(float(tokens), self.capacity[1]))
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated
+            self._updated = now
+            for i, capacity in enumerate(self.capacity):
+                self._available[i] = min(capacity, self._available[i] + elapsed * capacity / 60)
+
+            wait = max(
+                (want - available) * 60 / capacity
+                for want, available, capacity in zip(wanted, self._available, self.capacity)
+            )
+            if wait > self.max_wait:
+                raise RateLimitExceeded(wait)
+            # Reserve now (the balance may go negative) so later callers queue behind us
+            for i, want in enumerate(wanted):
+                self._available[i] -= want
+
+        if wait > 0:
+            time.sleep(wait)
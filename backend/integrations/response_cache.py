@@ -0,0 +1,153 @@
+"""
+In-memory response cache for LLM and search calls
+
+Exact-match LRU keyed on a hash of the request, plus an optional semantic
+tier that reuses a response when a new prompt embeds close enough to one
+already answered.
+"""
+
+import copy
+import hashlib
+import json
+import math
+import operator
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, List, Optional
+
+
+def make_cache_key(*parts) -> str:
+    """Stable blake2b hex digest of JSON-serializable request parts"""
+    payload = json.dumps(parts, sort_keys=True, default=str, separators=(',', ':'))
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class ResponseCache:
+    """Thread-safe LRU cache with an optional time-to-live per entry"""
+
+    def __init__(self, maxsize: int = 512, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return a copy of the cached value, or None on miss/expiry"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            stored_at, value = entry
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        # Callers are free to mutate what they get back (results get enriched in place)
+        return copy.deepcopy(value)
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a copy of value, evicting the least recently used entry if full"""
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {'size': len(self._entries), 'hits': self.hits, 'misses': self.misses}
+
+
+class SemanticCache:
+    """
+    Nearest-neighbour cache over prompt embeddings.
+
+    A lookup returns the stored value whose embedding has cosine similarity
+    >= threshold with the query. Entries are partitioned by namespace so e.g.
+    different models or time windows never answer for each other.
+
+    Text longer than max_chars is never embedded (so never cached or matched):
+    an embedder that truncates its input would otherwise treat texts that
+    only differ past the cut-off as identical.
+    """
+
+    def __init__(
+        self,
+        embed_fn: Callable[[str], List[float]],
+        threshold: float = 0.95,
+        maxsize: int = 256,
+        ttl: Optional[float] = None,
+        max_chars: Optional[int] = None
+    ):
+        self.embed_fn = embed_fn
+        self.max_chars = max_chars
+        self.threshold = threshold
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = []  # (namespace, unit_vector, stored_at, value)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def embed(self, text: str) -> Optional[List[float]]:
+        """Embed and L2-normalise text; returns None if the embedder fails or text is too long"""
+        if self.max_chars is not None and len(text) > self.max_chars:
+            return None
+        try:
+            vec = self.embed_fn(text)
+        except Exception as e:
+            print(f"[SemanticCache] Embedding failed: {e}")
+            return None
+        if not vec:
+            return None
+        norm = math.sqrt(sum(v * v for v in vec)) or 1.0
+        return [v / norm for v in vec]
+
+    def get(self, embedding: Optional[List[float]], namespace: str = '') -> Optional[Any]:
+        """Return a copy of the closest cached value above threshold, else None"""
+        if embedding is None:
+            return None
+        now = time.monotonic()
+        best_score, best_value = 0.0, None
+        with self._lock:
+            if self.ttl is not None:
+                self._entries = [e for e in self._entries if now - e[2] <= self.ttl]
+            for ns, vec, _, value in self._entries:
+                if ns != namespace:
+                    continue
+                score = sum(map(operator.mul, vec, embedding))
+                if score > best_score:
+                    best_score, best_value = score, value
+            if best_value is None or best_score < self.threshold:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return copy.deepcopy(best_value)
+
+    def set(self, embedding: Optional[List[float]], value: Any, namespace: str = '') -> None:
+        if embedding is None:
+            return
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._entries.append((namespace, embedding, time.monotonic(), value))
+            if len(self._entries) > self.maxsize:
+                del self._entries[:len(self._entries) - self.maxsize]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {'size': len(self._entries), 'hits': self.hits, 'misses': self.misses}
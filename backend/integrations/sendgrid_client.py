@@ -0,0 +1,69 @@
+"""
+SendGrid integration for transactional email (previews, doc links)
+
+Messages are built with the sendgrid helper classes, but sent over a shared
+keep-alive session so a batch of recipients reuses one TLS connection
+instead of the SDK's connection-per-send transport.
+"""
+
+import orjson
+import requests
+from urllib3.util.retry import Retry
+
+from .http_pool import build_requests_session
+
+SEND_URL = "https://api.sendgrid.com/v3/mail/send"
+
+# A send isn't idempotent: retry once only if the connection couldn't be made,
+# never after the request may have reached SendGrid (read errors, responses)
+SEND_RETRY = Retry(total=1, connect=1, read=0, status=0, other=0, redirect=0, allowed_methods=None)
+
+
+def with_recipients(base_body: bytes, emails) -> bytes:
+    """
+    Add one personalization per address to a serialized v3 payload that has none
+
+    Lets a batch serialize the (large) HTML body once with orjson and splice
+    the recipients in per request, instead of re-encoding the whole payload.
+    """
+    personalizations = orjson.dumps([{"to": [{"email": email}]} for email in emails])
+    return b'{"personalizations":' + personalizations + b',' + base_body[1:]
+
+
+class SendGridError(Exception):
+    """Non-2xx response from SendGrid (mirrors the SDK's HTTPError .status_code/.body)"""
+
+    def __init__(self, status_code: int, body: str):
+        super().__init__(f"SendGrid returned status {status_code}: {body[:200]}")
+        self.status_code = status_code
+        self.body = body
+
+
+class SendGridClient:
+    """Wrapper for the SendGrid v3 mail/send API"""
+
+    def __init__(self, api_key: str):
+        self.api_key = api_key
+        self.session = build_requests_session(max_retries=SEND_RETRY)
+        self.session.headers.update({
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json"
+        })
+
+    def send(self, message) -> requests.Response:
+        """
+        Send a sendgrid.helpers.mail.Mail, a ready v3 payload dict, or an
+        already serialized payload (bytes).
+
+        Raises SendGridError on a non-2xx response, like SendGridAPIClient.send.
+        """
+        if isinstance(message, bytes):
+            body = message
+        else:
+            payload = message.get() if hasattr(message, "get") and not isinstance(message, dict) else message
+            body = orjson.dumps(payload)
+
+        response = self.session.post(SEND_URL, data=body, timeout=30)
+        if response.status_code >= 300:
+            raise SendGridError(response.status_code, response.text)
+        return response
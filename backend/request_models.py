@@ -0,0 +1,58 @@
+"""
+Request body models for the heavier POST endpoints
+
+Each model is validated straight from the raw request bytes, so parsing and
+type checking happen in pydantic-core instead of a chain of dict.get calls.
+"""
+
+from typing import Dict, List, Optional, Union
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+
+class RequestModel(BaseModel):
+    """Base for request bodies: immutable, ignores unknown keys, null means 'not sent'"""
+
+    model_config = ConfigDict(frozen=True, extra='ignore', populate_by_name=True)
+
+    @model_validator(mode='before')
+    @classmethod
+    def _drop_nulls(cls, data):
+        # The frontend sends null for untouched fields; fall back to the defaults
+        if isinstance(data, dict):
+            return {key: value for key, value in data.items() if value is not None}
+        return data
+
+
+class ResearchArticlesRequest(RequestModel):
+    curious_claims_topic: Optional[dict] = None
+    roundup_topics: List[dict] = []  # List of 5 articles
+    spotlight_content: Optional[dict] = None  # Pre-generated spotlight content from Step 2B
+    agent_tips_topics: Union[List[dict], dict] = []  # Single article (older clients send a list)
+    stream: bool = False  # Server-sent events for the Claims and Agent Advantage text
+
+
+class GenerateContentRequest(RequestModel):
+    month: str = 'january'
+    research: Optional[dict] = None
+    brite_spot_topic: str = ''
+    intro_content: str = ''
+
+
+class GenerateImagesRequest(RequestModel):
+    prompts: Dict[str, str] = {}  # Pre-generated or user-edited prompts
+    format: Optional[str] = None
+    run_async: bool = Field(False, alias='async')
+
+
+class BrandCheckRequest(RequestModel):
+    claims_content: str = ''
+    roundup_content: str = ''
+    spotlight_content: str = ''
+    tips_content: str = ''
+    brite_spot_content: str = ''
+    run_async: bool = Field(False, alias='async')
+
+
+class BrandCheckBatchRequest(RequestModel):
+    payloads: List[BrandCheckRequest] = []
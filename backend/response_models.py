@@ -0,0 +1,27 @@
+"""
+Schemas for structured (JSON) output from the LLMs
+
+Model responses are validated straight from the raw text, so parsing and
+shape checking happen in one pydantic-core pass, and a reply with missing
+or mistyped fields is caught before it reaches the frontend.
+"""
+
+from typing import List
+
+from pydantic import BaseModel, ConfigDict
+
+
+class BrandCheckSuggestion(BaseModel):
+    model_config = ConfigDict(extra='ignore')
+
+    section: str = ''  # claims | roundup | spotlight | tips | brite_spot
+    issue: str = ''
+    original: str = ''
+    suggested: str = ''
+    reason: str = ''
+
+
+class BrandCheckResult(BaseModel):
+    model_config = ConfigDict(extra='ignore')
+
+    suggestions: List[BrandCheckSuggestion] = []
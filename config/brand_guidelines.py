@@ -3,6 +3,8 @@ BriteCo Brief - Agent Newsletter Configuration
 Brand guidelines and newsletter settings for insurance agents
 """
 
+from functools import lru_cache
+
 # Insurance news sources for search queries
 INSURANCE_NEWS_SOURCES = [
     "insurancenewsnet.com",
@@ -14,6 +16,9 @@ INSURANCE_NEWS_SOURCES = [
     "dig-in.com"
 ]
 
+# Pre-joined site: filter for search queries (the source list never changes at runtime)
+INSURANCE_SITE_FILTER = " OR ".join(f"site:{s}" for s in INSURANCE_NEWS_SOURCES)
+
 # Content filters - what to include/exclude
 CONTENT_FILTERS = {
     "include": [
@@ -296,6 +301,7 @@ BRITECO_BRAND = {
 }
 
 
+@lru_cache(maxsize=None)
 def get_style_guide_for_prompt(section_type=None):
     """
     Generate a prompt-friendly style guide string for AI content generation.
@@ -394,6 +400,7 @@ def get_section_style_examples(section_type):
     return None
 
 
+@lru_cache(maxsize=None)
 def get_search_sources_prompt():
     """
     Generate a search sources instruction for web search queries.
@@ -401,10 +408,9 @@ def get_search_sources_prompt():
     Returns:
         String with preferred sources for insurance news
     """
-    sources = " OR ".join([f"site:{s}" for s in INSURANCE_NEWS_SOURCES])
     return f"""
 PREFERRED SOURCES:
-Search these insurance industry publications: {sources}
+Search these insurance industry publications: {INSURANCE_SITE_FILTER}
 
 CONTENT REQUIREMENTS:
 - Focus on Property & Casualty (P&C) insurance only
@@ -611,6 +617,7 @@ HUMANIZATION_EXAMPLES = {
 }
 
 
+@lru_cache(maxsize=None)
 def get_humanization_guidelines(section_type=None):
     """
     Get humanization guidelines to avoid AI-sounding content.
@@ -660,6 +667,7 @@ def get_humanization_guidelines(section_type=None):
     return guide
 
 
+@lru_cache(maxsize=None)
 def get_full_style_guide_for_section(section_type):
     """
     Get the complete style guide for a section, combining structure + humanization.